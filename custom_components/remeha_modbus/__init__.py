@@ -1,14 +1,22 @@
 """The Remeha Modbus integration."""
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
-
-from dateutil import tz
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, CONF_TYPE, EVENT_HOMEASSISTANT_STARTED, Platform
+from collections.abc import Callable
+from typing import Any, Final
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_TIMEOUT,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STARTED,
+    Platform,
+)
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers.typing import NoEventData
+from homeassistant.util import dt
 from pymodbus import ModbusException
 
 from custom_components.remeha_modbus.api import (
@@ -16,20 +24,23 @@ from custom_components.remeha_modbus.api import (
     RemehaApi,
 )
 from custom_components.remeha_modbus.api.store import RemehaModbusStorage
-
-if TYPE_CHECKING:
-    from custom_components.remeha_modbus.blend.blender import Blender
+from custom_components.remeha_modbus.blend.blender import Blender
 from custom_components.remeha_modbus.const import (
     AUTO_SCHEDULE_SELECTED_SCHEDULE,
     CONFIG_AUTO_SCHEDULE,
     DOMAIN,
+    HA_CONFIG_MINOR_VERSION,
+    MODBUS_DEFAULT_TIMEOUT,
+    MODBUS_READ_ATTEMPTS,
+    MODBUS_SETUP_CONNECT_TIMEOUT,
+    MODBUS_SETUP_HEALTH_CHECK_TIMEOUT,
     REMEHA_PRESET_SCHEDULE_1,
     SERVICE_BOOTSTRAP_BLENDERS,
 )
-from custom_components.remeha_modbus.coordinator import RemehaUpdateCoordinator
+from custom_components.remeha_modbus.coordinator import RemehaRuntimeData, RemehaUpdateCoordinator
 from custom_components.remeha_modbus.services import register_services
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
     Platform.NUMBER,
@@ -37,10 +48,13 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.SWITCH,
     Platform.TIME,
-]
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_CONNECTION_TYPES: frozenset[str] = frozenset(e.value for e in ConnectionType)
+_CONNECTION_TYPES_DESCRIPTION: str = ", ".join(e.value for e in ConnectionType)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Remeha Modbus based on a config entry."""
@@ -48,38 +62,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     modbus_hub_name = entry.data[CONF_NAME]
     modbus_type = entry.data[CONF_TYPE]
 
-    if modbus_type not in ConnectionType:
-        connection_types: str = ", ".join(e.value for e in ConnectionType)
+    if modbus_type not in _CONNECTION_TYPES:
         raise ConfigEntryError(
-            f"{modbus_type} is not a valid connection type. Use one of [{connection_types}]"
+            f"{modbus_type} is not a valid connection type. "
+            f"Use one of [{_CONNECTION_TYPES_DESCRIPTION}]"
         )
 
     api: RemehaApi = RemehaApi.create(
         name=modbus_hub_name,
         config=entry.data,
-        time_zone=await hass.async_add_executor_job(tz.gettz, hass.config.time_zone),
+        time_zone=await dt.async_get_time_zone(hass.config.time_zone),
     )
 
     # Ensure the modbus device is reachable and actually talking Modbus
-    # before forwarding setup to other platforms.
+    # before forwarding setup to other platforms. Both steps are bounded, so an unresponsive
+    # gateway fails fast and lets HA retry the setup later instead of stalling startup.
+    # Slow gateways configured with a larger timeout get enough time for every read attempt.
+    timeout = float(entry.data.get(CONF_TIMEOUT, MODBUS_DEFAULT_TIMEOUT))
     try:
-        await api.async_connect()
-        await api.async_health_check()
+        async with asyncio.timeout(max(MODBUS_SETUP_CONNECT_TIMEOUT, timeout)):
+            await api.async_connect()
+        async with asyncio.timeout(
+            max(MODBUS_SETUP_HEALTH_CHECK_TIMEOUT, timeout * MODBUS_READ_ATTEMPTS)
+        ):
+            await api.async_health_check()
+    except TimeoutError as ex:
+        await api.async_close()
+        raise ConfigEntryNotReady("Timeout while executing modbus health check.") from ex
     except ModbusException as ex:
+        await api.async_close()
         raise ConfigEntryNotReady(f"Error while executing modbus health check: {ex}") from ex
 
     # Setup the coordinator
     coordinator = RemehaUpdateCoordinator(
         hass=hass, config_entry=entry, api=api, store=RemehaModbusStorage(hass=hass)
     )
-    entry.runtime_data = {"api": api, "coordinator": coordinator, "blenders": {}}
+    entry.runtime_data = RemehaRuntimeData(api=api, coordinator=coordinator, blenders={})
 
     # Services must be registered before the first data retrieval, since they're
     # called if something fails when retrieving the data.
     register_services(hass=hass, config=entry, coordinator=coordinator)
 
-    # Retrieve the first batch of data.
-    await coordinator.async_config_entry_first_refresh()
+    # Retrieve the first batch of data. HA does not unload entries that failed to set up,
+    # so release the (possibly shared) modbus client here.
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await api.async_close()
+        raise
 
     # And setup all platforms after the data is available.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -87,6 +117,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # After HA has started, bootstrap the blenders.
     async def _bootstrap_blenders(_: Event[NoEventData]) -> None:
         """Call the bootstrap_blenders service to set up communication with other integrations."""
+
+        # The entry may have been unloaded while Home Assistant was still starting.
+        if entry.state is not ConfigEntryState.LOADED:
+            return
+
         await hass.services.async_call(
             domain=DOMAIN,
             service=SERVICE_BOOTSTRAP_BLENDERS,
@@ -103,17 +138,40 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload the Remeha Modbus configuration."""
 
     # Close the connection to the modbus server.
-    coordinator: RemehaUpdateCoordinator = entry.runtime_data["coordinator"]
+    coordinator: RemehaUpdateCoordinator = entry.runtime_data.coordinator
     await coordinator.async_shutdown()
 
     # Unsubscribe from all subscriptions any blender might have.
-    blenders: dict[str, Blender] = entry.runtime_data["blenders"]
+    blenders: dict[str, Blender] = entry.runtime_data.blenders
     for blender in blenders.values():
         blender.unblend()
 
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+def _migrate_to_v1_1(data: dict[str, Any]) -> None:
+    # version 1.1 adds auto-scheduling configuration.
+    # For the migration, setting the parameter `auto_schedule` to `False` is enough:
+    # fully configuring auto scheduling, if desired, can be done by reconfiguring
+    # the integration.
+    data[CONFIG_AUTO_SCHEDULE] = False
+
+
+def _migrate_to_v1_2(data: dict[str, Any]) -> None:
+    # Version 1.2 adds a configurable schedule id to the auto-scheduling configuration.
+    # It defaults to SCHEDULE_1, so use that if CONFIG_AUTO_SCHEDULE is True
+    # (i.e. auto-scheduling) is used.
+    if data[CONFIG_AUTO_SCHEDULE] is True:
+        data[AUTO_SCHEDULE_SELECTED_SCHEDULE] = REMEHA_PRESET_SCHEDULE_1
+
+
+_MIGRATIONS: Final[tuple[tuple[int, Callable[[dict[str, Any]], None]], ...]] = (
+    (1, _migrate_to_v1_1),
+    (2, _migrate_to_v1_2),
+)
+"""The config data migrations of major version 1, by the minor version they migrate to."""
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate config entry to latest version."""
     _LOGGER.debug(
@@ -126,22 +184,20 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         _LOGGER.error("Cannot downgrade from future version.")
         return False
 
-    new_data = {**config_entry.data}
-    if config_entry.minor_version == 0:
-        # version 1.1 adds auto-scheduling configuration.
-        # For the migration, setting the parameter `auto_schedule` to `False` is enough:
-        # fully configuring auto scheduling, if desired, can be done by reconfiguring
-        # the integration.
-        new_data[CONFIG_AUTO_SCHEDULE] = False
-
-    if config_entry.minor_version < 2:
-        # Version 1.2 adds a configurable schedule id to the auto-scheduling configuration.
-        # It defaults to SCHEDULE_1, so use that if CONFIG_AUTO_SCHEDULE is True
-        # (i.e. auto-scheduling) is used.
-        if new_data[CONFIG_AUTO_SCHEDULE] is True:
-            new_data[AUTO_SCHEDULE_SELECTED_SCHEDULE] = REMEHA_PRESET_SCHEDULE_1
-
-    hass.config_entries.async_update_entry(config_entry, data=new_data, minor_version=2, version=1)
+    migrations = [
+        migrate
+        for minor_version, migrate in _MIGRATIONS
+        if config_entry.minor_version < minor_version
+    ]
+    if migrations:
+        new_data = dict(config_entry.data)
+        for migrate in migrations:
+            migrate(new_data)
+
+        hass.config_entries.async_update_entry(
+            config_entry, data=new_data, minor_version=HA_CONFIG_MINOR_VERSION, version=1
+        )
+
     _LOGGER.debug(
         "Migration to configuration version %s.%s successful",
         config_entry.version,
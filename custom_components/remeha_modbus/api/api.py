@@ -3,13 +3,14 @@
 import asyncio
 import logging
 import struct
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
 from datetime import datetime, tzinfo
 from enum import Enum, StrEnum, auto
 from types import MappingProxyType
-from typing import Any, Self, cast
+from typing import Any, Final, Self, cast
 
-from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TYPE
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TIMEOUT, CONF_TYPE
 from pymodbus import FramerType, ModbusException
 from pymodbus import client as ModbusClient
 from pymodbus.client import (
@@ -39,7 +40,14 @@ from custom_components.remeha_modbus.api.climate_zone import (
     is_domestic_hot_water,
 )
 from custom_components.remeha_modbus.const import (
+    MODBUS_CLIENT_RETRIES,
+    MODBUS_DEFAULT_TIMEOUT,
     MODBUS_DEVICE_ADDRESS,
+    MODBUS_ILLEGAL_DATA_ADDRESS,
+    MODBUS_MAX_REGISTER_GAP,
+    MODBUS_MAX_ZONE_REGISTER_GAP,
+    MODBUS_READ_ATTEMPTS,
+    MODBUS_RECONNECT_INTERVAL,
     MODBUS_SERIAL_BAUDRATE,
     MODBUS_SERIAL_BYTESIZE,
     MODBUS_SERIAL_METHOD,
@@ -56,12 +64,19 @@ from custom_components.remeha_modbus.const import (
     Weekday,
     ZoneRegisters,
 )
-from custom_components.remeha_modbus.errors import DiscoveryTableCorruptedError, InvalidZoneSchedule
+from custom_components.remeha_modbus.errors import (
+    DiscoveryTableCorruptedError,
+    InvalidZoneSchedule,
+    ModbusExceptionResponseError,
+)
 from custom_components.remeha_modbus.helpers.gtw08 import SteppedTimeOfDay, TimeOfDay
 from custom_components.remeha_modbus.helpers.modbus import (
     ModbusPrimitive,
+    RegisterBlock,
     bytes_from_registers,
+    from_register_block,
     from_registers,
+    plan_register_blocks,
     to_registers,
 )
 
@@ -87,34 +102,48 @@ class DeviceBoardType(Enum):
     EHC = 2
     """Motherboard for (hybrid) heat pumps like Mercuria Ace"""
 
-    MK = int("14", 16)
+    MK = 0x14
     """Appliance control panel like eTwist"""
 
-    SCB = int("19", 16)
+    SCB = 0x19
     """Circuit control board"""
 
-    EEC = int("1b", 16)
+    EEC = 0x1B
     """Motherboard for gas boilers like GAS 120 Ace"""
 
-    EHC_ALT = int("21", 16)
+    EHC_ALT = 0x21
     """Unknown/alternate heatpump mainboard (seen on Confida)"""
 
-    GATEWAY = int("1e", 16)
+    GATEWAY = 0x1E
     """A gateway, for example GTW-08 (modbus gateway)"""
 
     def is_mainboard(self) -> bool:
         """Return whether this value represents a mainboard, a.k.a. the main device."""
 
-        return self in [
-            DeviceBoardType.CU_GH,
-            DeviceBoardType.CU_OH,
-            DeviceBoardType.EHC,
-            DeviceBoardType.EHC_ALT,
-            DeviceBoardType.EEC,
-        ]
+        return self in _MAINBOARD_TYPES
+
+
+_MAINBOARD_TYPES: Final[frozenset[DeviceBoardType]] = frozenset(
+    {
+        DeviceBoardType.CU_GH,
+        DeviceBoardType.CU_OH,
+        DeviceBoardType.EHC,
+        DeviceBoardType.EHC_ALT,
+        DeviceBoardType.EEC,
+    }
+)
+"""The board types of mainboards."""
 
 
-@dataclass(eq=False)
+_BOARD_TYPE_NAMES: Final[dict[DeviceBoardType, str]] = {
+    DeviceBoardType.CU_GH: "CU-GH",
+    DeviceBoardType.CU_OH: "CU-OH",
+    DeviceBoardType.GATEWAY: "GTW",
+}
+"""Display names of the board types that differ from their enum member name."""
+
+
+@dataclass(eq=False, slots=True)
 class DeviceBoardCategory:
     """The category of the device located on the appliance."""
 
@@ -127,18 +156,7 @@ class DeviceBoardCategory:
     def __str__(self):
         """Textual representation of this DeviceBoardCategory."""
 
-        name: str
-        match self.type:
-            case DeviceBoardType.CU_GH:
-                name = "CU-GH"
-            case DeviceBoardType.CU_OH:
-                name = "CU-OH"
-            case DeviceBoardType.GATEWAY:
-                name = "GTW"
-            case _:
-                name = self.type.name
-
-        return f"{name}-{self.generation}"
+        return f"{_BOARD_TYPE_NAMES.get(self.type, self.type.name)}-{self.generation}"
 
     def __eq__(self, other) -> bool:
         """Compare this `DeviceBoardCategory` to another for equality.
@@ -161,7 +179,7 @@ class DeviceBoardCategory:
         return hash(self.type)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DeviceInstance:
     """A device (electronic board) somewhere on the Remeha appliance."""
 
@@ -231,6 +249,170 @@ class SerialConnectionMethod(StrEnum):
     """ASCII data transmission preceded by slave id and followed by a crc. Used for new devices."""
 
 
+def _create_serial_client(config: Mapping[str, Any]) -> ModbusBaseClient:
+    return AsyncModbusSerialClient(
+        name="remeha_modbus_serial",
+        port=config[CONF_PORT],
+        baudrate=config[MODBUS_SERIAL_BAUDRATE],
+        bytesize=config[MODBUS_SERIAL_BYTESIZE],
+        framer=config[MODBUS_SERIAL_METHOD],
+        parity=config[MODBUS_SERIAL_PARITY],
+        stopbits=config[MODBUS_SERIAL_STOPBITS],
+        retries=MODBUS_CLIENT_RETRIES,
+    )
+
+
+def _create_tcp_client(config: Mapping[str, Any]) -> ModbusBaseClient:
+    return AsyncModbusTcpClient(
+        name="remeha_modbus_tcp",
+        host=config[CONF_HOST],
+        port=int(config[CONF_PORT]),
+        framer=FramerType.SOCKET,
+        timeout=float(config.get(CONF_TIMEOUT, MODBUS_DEFAULT_TIMEOUT)),
+        retries=MODBUS_CLIENT_RETRIES,
+    )
+
+
+def _create_udp_client(config: Mapping[str, Any]) -> ModbusBaseClient:
+    return AsyncModbusUdpClient(
+        name="remeha_modbus_udp",
+        host=config[CONF_HOST],
+        port=int(config[CONF_PORT]),
+        framer=FramerType.SOCKET,
+        timeout=float(config.get(CONF_TIMEOUT, MODBUS_DEFAULT_TIMEOUT)),
+        retries=MODBUS_CLIENT_RETRIES,
+    )
+
+
+def _create_rtu_over_tcp_client(config: Mapping[str, Any]) -> ModbusBaseClient:
+    return AsyncModbusTcpClient(
+        name="remeha_modbus_rtu_over_tcp",
+        host=config[CONF_HOST],
+        port=int(config[CONF_PORT]),
+        framer=FramerType.RTU,
+        timeout=float(config.get(CONF_TIMEOUT, MODBUS_DEFAULT_TIMEOUT)),
+        retries=MODBUS_CLIENT_RETRIES,
+    )
+
+
+_CLIENT_FACTORIES: Final[dict[ConnectionType, Callable[[Mapping[str, Any]], ModbusBaseClient]]] = {
+    ConnectionType.SERIAL: _create_serial_client,
+    ConnectionType.TCP: _create_tcp_client,
+    ConnectionType.UDP: _create_udp_client,
+    ConnectionType.RTU_OVER_TCP: _create_rtu_over_tcp_client,
+}
+"""The modbus client constructors by connection type."""
+
+_APPLIANCE_VARIABLES: Final[tuple[ModbusVariableDescription, ...]] = (
+    MetaRegisters.APPLIANCE_DEMAND_STATUS,
+    MetaRegisters.CURRENT_ERROR,
+    MetaRegisters.ERROR_PRIORITY,
+    MetaRegisters.APPLIANCE_STATUS_1,
+    MetaRegisters.APPLIANCE_STATUS_2,
+    MetaRegisters.SEASON_MODE,
+    MetaRegisters.SUMMER_WINTER,
+    MetaRegisters.NEUTRAL_BAND_SUMMER_WINTER,
+    MetaRegisters.FORCE_SUMMER,
+    MetaRegisters.SILENT_MODE,
+    MetaRegisters.SILENT_MODE_START_TIME,
+    MetaRegisters.SILENT_MODE_END_TIME,
+    MetaRegisters.CH_ENABLED,
+    MetaRegisters.COOLING_ENABLED,
+    MetaRegisters.COOLING_FORCED,
+)
+"""The variables that make up the appliance status."""
+
+_DEVICE_INSTANCE_VARIABLES: Final[tuple[ModbusVariableDescription, ...]] = (
+    DeviceInstanceRegisters.TYPE_BOARD,
+    DeviceInstanceRegisters.SW_VERSION,
+    DeviceInstanceRegisters.HW_VERSION,
+    DeviceInstanceRegisters.ARTICLE_NUMBER,
+)
+"""The variables that make up a device instance."""
+
+_ZONE_VARIABLES: Final[tuple[ModbusVariableDescription, ...]] = (
+    ZoneRegisters.FUNCTION,
+    ZoneRegisters.SHORT_NAME,
+    ZoneRegisters.OWNING_DEVICE,
+    ZoneRegisters.MODE,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_1,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_2,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_3,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_4,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_5,
+    ZoneRegisters.TEMPORARY_SETPOINT,
+    ZoneRegisters.ROOM_MANUAL_SETPOINT,
+    ZoneRegisters.DHW_COMFORT_SETPOINT,
+    ZoneRegisters.DHW_REDUCED_SETPOINT,
+    ZoneRegisters.DHW_CALORIFIER_HYSTERESIS,
+    ZoneRegisters.SELECTED_TIME_PROGRAM,
+    ZoneRegisters.END_TIME_MODE_CHANGE,
+    ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
+    ZoneRegisters.CURRENT_HEATING_MODE,
+    ZoneRegisters.PUMP_RUNNING,
+    ZoneRegisters.DHW_TANK_TEMPERATURE,
+)
+"""The variables that make up a climate zone, except for its type which is read up front."""
+
+_ZONE_UPDATE_VARIABLES: Final[tuple[ModbusVariableDescription, ...]] = (
+    ZoneRegisters.MODE,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_1,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_2,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_3,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_4,
+    ZoneRegisters.ROOM_COOLING_SETPOINT_5,
+    ZoneRegisters.TEMPORARY_SETPOINT,
+    ZoneRegisters.ROOM_MANUAL_SETPOINT,
+    ZoneRegisters.DHW_COMFORT_SETPOINT,
+    ZoneRegisters.DHW_REDUCED_SETPOINT,
+    ZoneRegisters.DHW_CALORIFIER_HYSTERESIS,
+    ZoneRegisters.SELECTED_TIME_PROGRAM,
+    ZoneRegisters.END_TIME_MODE_CHANGE,
+    ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
+    ZoneRegisters.CURRENT_HEATING_MODE,
+    ZoneRegisters.PUMP_RUNNING,
+    ZoneRegisters.DHW_TANK_TEMPERATURE,
+)
+"""The climate zone variables that can change without reconfiguring the appliance."""
+
+
+def _to_optional_enum[E: Enum](enum_type: type[E], value: Any) -> E | None:
+    """Convert `value` to a member of `enum_type`, or return `None` if `value` is `None`."""
+    return None if value is None else enum_type(value)
+
+
+type _ClientPoolKey = tuple[ConnectionType, str, int, float]
+
+
+@dataclass
+class _ConnectionState:
+    """The state of a modbus connection, shared by all `RemehaApi` instances using its client."""
+
+    reconnect_failed_at: float | None = None
+    """Event loop time of the last failed reconnect, used to throttle reconnect attempts."""
+
+
+@dataclass
+class _PooledClient:
+    """A modbus client that is shared by all `RemehaApi` instances connecting to the same gateway."""
+
+    client: ModbusBaseClient
+    """The shared modbus client."""
+
+    lock: asyncio.Lock
+    """The lock serializing requests on the shared client."""
+
+    connection_state: _ConnectionState
+    """The connection state of the shared client."""
+
+    references: int = 1
+    """The amount of `RemehaApi` instances using the client."""
+
+
+_CLIENT_POOL: dict[_ClientPoolKey, _PooledClient] = {}
+"""Network clients by (connection type, host, port, timeout), so entries behind one gateway share a connection."""
+
+
 #################################
 ###     remeha_modbus API     ###
 #################################
@@ -246,6 +428,10 @@ class RemehaApi:
         client: ModbusClient.ModbusBaseClient,
         device_address: int = 1,
         time_zone: tzinfo | None = None,
+        *,
+        lock: asyncio.Lock | None = None,
+        connection_state: _ConnectionState | None = None,
+        pool_key: _ClientPoolKey | None = None,
     ):
         """Create a new API instance."""
         self._client: ModbusClient.ModbusBaseClient = client
@@ -253,8 +439,13 @@ class RemehaApi:
         self._name = name
         self._connection_type = connection_type
         self._device_address = device_address
-        self._lock = asyncio.Lock()
+        self._lock = lock or asyncio.Lock()
+        self._connection_state = connection_state or _ConnectionState()
         self._time_zone = time_zone
+        self._pool_key = pool_key
+
+        # Register blocks (address, count) the device refused to read in a single request.
+        self._split_blocks: set[tuple[int, int]] = set()
 
     @classmethod
     def create(
@@ -262,6 +453,11 @@ class RemehaApi:
     ) -> Self:
         """Create a new `RemehaApi` instance.
 
+        Network clients are shared between instances connecting to the same host and port, since
+        modbus gateways typically accept only a few concurrent connections. The timeout is a
+        setting of the client, so entries configured with different timeouts use separate clients.
+        Serial clients are never shared.
+
         Args:
             name (str): The name of the modbus hub name.
             config (MappingProxyType[str, Any]): The dict containing the configuration of the related `ConfigEntry`.
@@ -269,49 +465,44 @@ class RemehaApi:
 
         """
         connection_type: ConnectionType = config[CONF_TYPE]
-        client: ModbusBaseClient
-        match connection_type:
-            case ConnectionType.SERIAL:
-                client = AsyncModbusSerialClient(
-                    name="remeha_modbus_serial",
-                    port=config[CONF_PORT],
-                    baudrate=config[MODBUS_SERIAL_BAUDRATE],
-                    bytesize=config[MODBUS_SERIAL_BYTESIZE],
-                    framer=config[MODBUS_SERIAL_METHOD],
-                    parity=config[MODBUS_SERIAL_PARITY],
-                    stopbits=config[MODBUS_SERIAL_STOPBITS],
-                )
-            case ConnectionType.TCP:
-                client = AsyncModbusTcpClient(
-                    name="remeha_modbus_tcp",
-                    host=config[CONF_HOST],
-                    port=int(config[CONF_PORT]),
-                    framer=FramerType.SOCKET,
-                    timeout=120,
-                )
-            case ConnectionType.UDP:
-                client = AsyncModbusUdpClient(
-                    name="remeha_modbus_udp",
-                    host=config[CONF_HOST],
-                    port=int(config[CONF_PORT]),
-                    framer=FramerType.SOCKET,
-                    timeout=120,
-                )
-            case ConnectionType.RTU_OVER_TCP:
-                client = AsyncModbusTcpClient(
-                    name="remeha_modbus_rtu_over_tcp",
-                    host=config[CONF_HOST],
-                    port=int(config[CONF_PORT]),
-                    framer=FramerType.RTU,
-                    timeout=120,
+        pool_key: _ClientPoolKey | None = None
+        if connection_type != ConnectionType.SERIAL:
+            pool_key = (
+                connection_type,
+                config[CONF_HOST],
+                int(config[CONF_PORT]),
+                float(config.get(CONF_TIMEOUT, MODBUS_DEFAULT_TIMEOUT)),
+            )
+            if (pooled := _CLIENT_POOL.get(pool_key)) is not None:
+                pooled.references += 1
+                return cls(
+                    name=name,
+                    connection_type=connection_type,
+                    client=pooled.client,
+                    device_address=config[MODBUS_DEVICE_ADDRESS],
+                    time_zone=time_zone,
+                    lock=pooled.lock,
+                    connection_state=pooled.connection_state,
+                    pool_key=pool_key,
                 )
 
+        client: ModbusBaseClient = _CLIENT_FACTORIES[connection_type](config)
+        lock = asyncio.Lock()
+        connection_state = _ConnectionState()
+        if pool_key is not None:
+            _CLIENT_POOL[pool_key] = _PooledClient(
+                client=client, lock=lock, connection_state=connection_state
+            )
+
         return cls(
             name=name,
             connection_type=connection_type,
             client=client,
             device_address=config[MODBUS_DEVICE_ADDRESS],
             time_zone=time_zone,
+            lock=lock,
+            connection_state=connection_state,
+            pool_key=pool_key,
         )
 
     @property
@@ -325,10 +516,9 @@ class RemehaApi:
         return self._connection_type
 
     @property
-    async def async_is_connected(self) -> bool:
+    def is_connected(self) -> bool:
         """Return whether we're connected to the modbus device."""
-        async with self._lock:
-            return self._client.connected
+        return self._client.connected
 
     async def async_read_registers(
         self, start_register: int, register_count: int = 1, struct_format: str | bytes = "=H"
@@ -368,11 +558,82 @@ class RemehaApi:
 
             return True
 
+    async def _async_reconnect(self) -> None:
+        """Reconnect to the modbus device if the connection was lost. The caller must hold the lock.
+
+        After a failed attempt, reconnecting is not tried again for `MODBUS_RECONNECT_INTERVAL` seconds,
+        to prevent every request from waiting for a connection timeout while the device is unreachable.
+        The throttle is shared by all instances using the same (pooled) client.
+
+        Raises:
+            ModbusException: If the connection could not be restored.
+
+        """
+
+        if self._client.connected:
+            return
+
+        state = self._connection_state
+        now: float = asyncio.get_running_loop().time()
+        if (
+            state.reconnect_failed_at is not None
+            and now - state.reconnect_failed_at < MODBUS_RECONNECT_INTERVAL
+        ):
+            raise ModbusException("Connection to modbus device lost.")
+
+        if not await self._client.connect():
+            state.reconnect_failed_at = now
+            raise ModbusException("Connection to modbus device lost.")
+
+        state.reconnect_failed_at = None
+
+    async def _async_ensure_connected(self) -> None:
+        """Ensure that we're connected to the modbus device, reconnecting if required.
+
+        Raises:
+            ModbusException: If the connection could not be restored.
+
+        """
+
+        if self._client.connected:
+            return
+
+        # Concurrent reads must not all try to reconnect at the same time.
+        async with self._lock:
+            await self._async_reconnect()
+
+    def _release_client(self) -> bool:
+        """Release this instance's reference to a pooled modbus client.
+
+        Returns:
+            `bool`: `True` if no other `RemehaApi` uses the client anymore, `False` otherwise.
+
+        """
+
+        if self._pool_key is None:
+            return True
+
+        pool_key, self._pool_key = self._pool_key, None
+        pooled = _CLIENT_POOL.get(pool_key)
+        if pooled is None or pooled.client is not self._client:
+            return True
+
+        pooled.references -= 1
+        if pooled.references > 0:
+            return False
+
+        del _CLIENT_POOL[pool_key]
+        return True
+
     async def async_close(self) -> None:
-        """Close the connection to the configured modbus device."""
+        """Close the connection to the configured modbus device.
+
+        If the connection is shared with other `RemehaApi` instances, it is only closed after
+        the last one releases it.
+        """
 
         async with self._lock:
-            if self._client.connected:
+            if self._release_client() and self._client.connected:
                 try:
                     self._client.close()
                 except ModbusException as ex:
@@ -402,20 +663,34 @@ class RemehaApi:
 
         """
 
-        async def _async_ensure_connected() -> None:
-            """Ensure that we're connected or raise an exception."""
-            if not self._client.connected and not await self._client.connect():
-                raise ModbusException("Connection to modbus device lost.")
+        return await self._async_read_holding_registers(
+            address=variable.start_address + offset, count=cast(int, variable.count)
+        )
+
+    async def _async_read_holding_registers(self, address: int, count: int) -> list[int]:
+        """Read `count` holding registers starting at `address`, retrying failed requests.
+
+        Args:
+            address (int): The address of the first register to read.
+            count (int): The amount of registers to read.
+
+        Returns:
+            list[int]: The requested registers.
+
+        Raises:
+            ModbusExceptionResponseError: If the device rejects the requested registers as an illegal data address.
+            ModbusException: If the connection to the modbus device is lost or if the request fails.
+
+        """
 
-        address: int = variable.start_address + offset
         retries: int = 0
         last_error: str = "unknown error"
-        while retries < 3:
-            await _async_ensure_connected()
+        while retries < MODBUS_READ_ATTEMPTS:
+            await self._async_ensure_connected()
 
             try:
                 response = await self._client.read_holding_registers(
-                    address=address, count=cast(int, variable.count), device_id=self._device_address
+                    address=address, count=count, device_id=self._device_address
                 )
             except ModbusException as ex:
                 # A missing reply (timeout) raises instead of returning an error response.
@@ -428,6 +703,13 @@ class RemehaApi:
                 continue
 
             if response.isError():
+                # The device will keep rejecting registers it doesn't define, so don't retry.
+                if response.exception_code == MODBUS_ILLEGAL_DATA_ADDRESS:
+                    raise ModbusExceptionResponseError(
+                        f"Modbus device rejected reading {count} registers at address {address}.",
+                        exception_code=response.exception_code,
+                    )
+
                 retries += 1
                 last_error = f"error code {response.exception_code}"
                 await asyncio.sleep(0.001)
@@ -442,6 +724,84 @@ class RemehaApi:
             f"after {retries} retries: {last_error}."
         )
 
+    async def _async_read_variables(
+        self,
+        variables: Iterable[ModbusVariableDescription],
+        offset: int = 0,
+        *,
+        max_gap: int = MODBUS_MAX_REGISTER_GAP,
+    ) -> dict[ModbusVariableDescription, Any]:
+        """Read and deserialize multiple variables, using as few requests as possible.
+
+        Variables located near each other are read in a single request; see `plan_register_blocks`.
+        The requests are issued concurrently; the modbus client still sends one request at a time.
+
+        Args:
+            variables (Iterable[ModbusVariableDescription]): The variables to read.
+            offset (int): The offset for the start address of each variable, in registers. Used for zone and device info registers.
+            max_gap (int): The maximum amount of unused registers to read in between two variables.
+
+        Returns:
+            `dict[ModbusVariableDescription, Any]`: A mapping from each variable to its deserialized value.
+
+        Raises:
+            ModbusException: If the connection to the modbus device is lost or if a request fails.
+            ValueError: If deserializing any of the variables fails.
+
+        """
+
+        values: dict[ModbusVariableDescription, Any] = {}
+        for block_values in await asyncio.gather(
+            *(
+                self._async_read_block(block=block, offset=offset)
+                for block in plan_register_blocks(variables, max_gap=max_gap)
+            )
+        ):
+            values.update(block_values)
+
+        return values
+
+    async def _async_read_block(
+        self, block: RegisterBlock, offset: int = 0
+    ) -> dict[ModbusVariableDescription, Any]:
+        """Read and deserialize all variables in `block`.
+
+        Some devices reject reads that include registers they don't define. If the device rejects a
+        block with an illegal data address response but reading its variables separately succeeds, the
+        block is read per variable from then on. Other errors are considered transient and are raised.
+        """
+
+        address: int = block.start_address + offset
+        if len(block.variables) > 1 and (address, block.count) not in self._split_blocks:
+            try:
+                registers = await self._async_read_holding_registers(
+                    address=address, count=block.count
+                )
+            except ModbusExceptionResponseError as ex:
+                if ex.exception_code != MODBUS_ILLEGAL_DATA_ADDRESS:
+                    raise
+
+                _LOGGER.debug(
+                    "Reading %d registers at address %d was rejected, reading its variables separately.",
+                    block.count,
+                    address,
+                    exc_info=ex,
+                )
+            else:
+                return from_register_block(block=block, registers=registers)
+
+        values: dict[ModbusVariableDescription, Any] = {}
+        for variable in block.variables:
+            values[variable] = from_registers(
+                registers=await self._async_read_registers(variable=variable, offset=offset),
+                destination_variable=variable,
+            )
+
+        if len(block.variables) > 1:
+            self._split_blocks.add((address, block.count))
+
+        return values
+
     async def _async_write_registers(
         self, variable: ModbusVariableDescription, registers: list[int], offset: int = 0
     ) -> None:
@@ -459,12 +819,8 @@ class RemehaApi:
 
         """
 
-        async def _async_ensure_connected() -> None:
-            if not self._client.connected and not await self._client.connect():
-                raise ModbusException("Connection to modbus device lost.")
-
         async with self._lock:
-            await _async_ensure_connected()
+            await self._async_reconnect()
             response: ModbusPDU = await self._client.write_registers(
                 address=variable.start_address + offset,
                 values=registers,
@@ -491,9 +847,7 @@ class RemehaApi:
             if zone_mode is ClimateZoneMode.SCHEDULING
             and zone_function.has_cooling_capability()
             and appliance_requires_cooling
-            else ClimateZoneScheduleId(selected_schedule)
-            if selected_schedule is not None
-            else None
+            else _to_optional_enum(ClimateZoneScheduleId, selected_schedule)
         )
 
     async def _async_read_schedules(
@@ -556,6 +910,8 @@ class RemehaApi:
     async def async_read_device_instances(self) -> list[DeviceInstance]:
         """Retrieve the available devices instances of the Remeha appliance.
 
+        The instances are requested concurrently; the modbus client still sends one request at a time.
+
         Returns
             `list[DeviceInstance]`: A list of all discovered device instances.
 
@@ -565,14 +921,14 @@ class RemehaApi:
         """
 
         number_of_instances: int = await self.async_read_number_of_device_instances()
-        return [
-            instance
-            for instance in [
-                await self.async_read_device_instance(instance_id)
+        instances = await asyncio.gather(
+            *(
+                self.async_read_device_instance(instance_id)
                 for instance_id in range(number_of_instances)
-            ]
-            if instance is not None
-        ]
+            )
+        )
+
+        return [instance for instance in instances if instance is not None]
 
     async def async_read_number_of_device_instances(self) -> int:
         """Retrieve the number of available  device instances in the appliance.
@@ -601,7 +957,7 @@ class RemehaApi:
 
         This reads the registers as described in the table below. Only the base zone registers
         are mentioned here; add `6 * id` to get the discrete register number of the zone.
-        For details, refer to the Remeha GTW-08 parameter list.
+        For details, refer to the Remeha GTW-08 parameter list. All registers are read in a single request.
 
         | Base address  | Variable name                 | Description                                           | Modbus type   | HA type                   |
         |---------------|-------------------------------|-------------------------------------------------------|---------------|---------------------------|
@@ -622,46 +978,13 @@ class RemehaApi:
 
         """
         device_register_offset: int = self.get_device_register_offset(id)
-        board_category = cast(
-            tuple[int, int],
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=DeviceInstanceRegisters.TYPE_BOARD,
-                    offset=device_register_offset,
-                ),
-                destination_variable=DeviceInstanceRegisters.TYPE_BOARD,
-            ),
-        )
-        sw_version = cast(
-            tuple[int, int],
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=DeviceInstanceRegisters.SW_VERSION,
-                    offset=device_register_offset,
-                ),
-                destination_variable=DeviceInstanceRegisters.SW_VERSION,
-            ),
-        )
-        hw_version = cast(
-            tuple[int, int],
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=DeviceInstanceRegisters.HW_VERSION,
-                    offset=device_register_offset,
-                ),
-                destination_variable=DeviceInstanceRegisters.HW_VERSION,
-            ),
-        )
-        article_number = cast(
-            int,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=DeviceInstanceRegisters.ARTICLE_NUMBER,
-                    offset=device_register_offset,
-                ),
-                destination_variable=DeviceInstanceRegisters.ARTICLE_NUMBER,
-            ),
+        values = await self._async_read_variables(
+            variables=_DEVICE_INSTANCE_VARIABLES, offset=device_register_offset
         )
+        board_category = cast(tuple[int, int], values[DeviceInstanceRegisters.TYPE_BOARD])
+        sw_version = cast(tuple[int, int], values[DeviceInstanceRegisters.SW_VERSION])
+        hw_version = cast(tuple[int, int], values[DeviceInstanceRegisters.HW_VERSION])
+        article_number = cast(int, values[DeviceInstanceRegisters.ARTICLE_NUMBER])
 
         return DeviceInstance(
             id=id,
@@ -685,69 +1008,15 @@ class RemehaApi:
 
         """
 
-        silent_mode = cast(
-            int,
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.SILENT_MODE),
-                destination_variable=MetaRegisters.SILENT_MODE,
-            ),
-        )
-
-        silent_mode_start_time_steps = cast(
-            int,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=MetaRegisters.SILENT_MODE_START_TIME
-                ),
-                destination_variable=MetaRegisters.SILENT_MODE_START_TIME,
-            ),
-        )
-
-        silent_mode_end_time_steps = cast(
-            int,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=MetaRegisters.SILENT_MODE_END_TIME
-                ),
-                destination_variable=MetaRegisters.SILENT_MODE_END_TIME,
-            ),
-        )
-
-        ch_enabled = bool(
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.CH_ENABLED),
-                destination_variable=MetaRegisters.CH_ENABLED,
-            )
-        )
-
-        cooling_type: int = cast(
-            int,
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.COOLING_ENABLED),
-                destination_variable=MetaRegisters.COOLING_ENABLED,
-            ),
-        )
-
-        cooling_forced = bool(
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.COOLING_FORCED),
-                destination_variable=MetaRegisters.COOLING_FORCED,
-            )
-        )
-
-        current_error = cast(
-            int,
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.CURRENT_ERROR),
-                destination_variable=MetaRegisters.CURRENT_ERROR,
-            ),
-        )
-
-        raw_error_priority = from_registers(
-            registers=await self._async_read_registers(variable=MetaRegisters.ERROR_PRIORITY),
-            destination_variable=MetaRegisters.ERROR_PRIORITY,
-        )
-
+        values = await self._async_read_variables(variables=_APPLIANCE_VARIABLES)
+        silent_mode = cast(int, values[MetaRegisters.SILENT_MODE])
+        silent_mode_start_time_steps = cast(int, values[MetaRegisters.SILENT_MODE_START_TIME])
+        silent_mode_end_time_steps = cast(int, values[MetaRegisters.SILENT_MODE_END_TIME])
+        ch_enabled = bool(values[MetaRegisters.CH_ENABLED])
+        cooling_type = cast(int, values[MetaRegisters.COOLING_ENABLED])
+        cooling_forced = bool(values[MetaRegisters.COOLING_FORCED])
+        current_error = cast(int, values[MetaRegisters.CURRENT_ERROR])
+        raw_error_priority = values[MetaRegisters.ERROR_PRIORITY]
         error_priority: ApplianceErrorPriority = (
             ApplianceErrorPriority(raw_error_priority)
             if raw_error_priority
@@ -755,70 +1024,17 @@ class RemehaApi:
         )
         appliance_status: ApplianceStatus = ApplianceStatus(
             bits=(
-                cast(
-                    int,
-                    from_registers(
-                        registers=await self._async_read_registers(
-                            variable=MetaRegisters.APPLIANCE_STATUS_1
-                        ),
-                        destination_variable=MetaRegisters.APPLIANCE_STATUS_1,
-                    ),
-                ),
-                cast(
-                    int,
-                    from_registers(
-                        registers=await self._async_read_registers(
-                            variable=MetaRegisters.APPLIANCE_STATUS_2
-                        ),
-                        destination_variable=MetaRegisters.APPLIANCE_STATUS_2,
-                    ),
-                ),
+                cast(int, values[MetaRegisters.APPLIANCE_STATUS_1]),
+                cast(int, values[MetaRegisters.APPLIANCE_STATUS_2]),
             )
         )
-
-        sm_value: int | None = cast(
-            int | None,
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.SEASON_MODE),
-                destination_variable=MetaRegisters.SEASON_MODE,
-            ),
-        )
-        season_mode: SeasonalMode | None = SeasonalMode(sm_value) if sm_value is not None else None
-
-        summer_winter: float = cast(
-            float,
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.SUMMER_WINTER),
-                destination_variable=MetaRegisters.SUMMER_WINTER,
-            ),
-        )
-
-        neutral_band_summer_winter: float = cast(
-            float,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=MetaRegisters.NEUTRAL_BAND_SUMMER_WINTER
-                ),
-                destination_variable=MetaRegisters.NEUTRAL_BAND_SUMMER_WINTER,
-            ),
-        )
-
-        force_summer = bool(
-            from_registers(
-                registers=await self._async_read_registers(variable=MetaRegisters.FORCE_SUMMER),
-                destination_variable=MetaRegisters.FORCE_SUMMER,
-            )
-        )
-
-        raw_demand_status = cast(
-            int | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=MetaRegisters.APPLIANCE_DEMAND_STATUS
-                ),
-                destination_variable=MetaRegisters.APPLIANCE_DEMAND_STATUS,
-            ),
+        season_mode: SeasonalMode | None = _to_optional_enum(
+            SeasonalMode, values[MetaRegisters.SEASON_MODE]
         )
+        summer_winter = cast(float, values[MetaRegisters.SUMMER_WINTER])
+        neutral_band_summer_winter = cast(float, values[MetaRegisters.NEUTRAL_BAND_SUMMER_WINTER])
+        force_summer = bool(values[MetaRegisters.FORCE_SUMMER])
+        raw_demand_status = cast(int | None, values[MetaRegisters.APPLIANCE_DEMAND_STATUS])
 
         return Appliance(
             silent_mode=SilentMode(silent_mode),
@@ -842,6 +1058,8 @@ class RemehaApi:
     ) -> dict[ModbusVariableDescription, Any]:
         """Read the values of the given list of variable descriptions.
 
+        Variables located near each other are read in a single request.
+
         Args:
             descriptions (list[ModbusVariableDescription]): The list of modbus variables to retrieve.
 
@@ -850,19 +1068,8 @@ class RemehaApi:
 
         """
 
-        return dict(
-            zip(
-                descriptions,
-                [
-                    from_registers(
-                        registers=await self._async_read_registers(variable=d),
-                        destination_variable=d,
-                    )
-                    for d in descriptions
-                ],
-                strict=True,
-            )
-        )
+        values = await self._async_read_variables(descriptions)
+        return {d: values[d] for d in descriptions}
 
     async def async_read_zones(self, appliance: Appliance) -> list[ClimateZone]:
         """Retrieve the available zones of the modbus device.
@@ -870,6 +1077,8 @@ class RemehaApi:
         This method returns the all zones having a supported `ClimateZoneFunction`.
         Whether a zone function is supported can be queried using `ClimateZoneFunction.is_supported()`
 
+        The zones are requested concurrently; the modbus client still sends one request at a time.
+
         Args:
             appliance (Appliance): The appliance to which the zones belong.
 
@@ -888,14 +1097,11 @@ class RemehaApi:
         if number_of_zones is None or number_of_zones == 0:
             raise DiscoveryTableCorruptedError("number_of_zones")
 
-        return [
-            zone
-            for zone in [
-                await self.async_read_zone(zone_id, appliance)
-                for zone_id in range(1, number_of_zones + 1)
-            ]
-            if zone is not None
-        ]
+        zones = await asyncio.gather(
+            *(self.async_read_zone(zone_id, appliance) for zone_id in range(1, number_of_zones + 1))
+        )
+
+        return [zone for zone in zones if zone is not None]
 
     async def async_read_number_of_zones(self) -> int | None:
         """Retrieve the number of zones defined in the appliance.
@@ -921,7 +1127,8 @@ class RemehaApi:
 
         This reads the registers as described in the table below. Only the base zone registers
         are mentioned here; add `512 * id` to get the discrete register number of the zone.
-        For details, refer to the Remeha GTW-08 parameter list.
+        For details, refer to the Remeha GTW-08 parameter list. The zone type is read first, and
+        the remaining registers are only read if the zone is present, in as few requests as possible.
 
         | Base address  | Variable name                     | Description                                           | Modbus type   | HA type                   |
         |---------------|-----------------------------------|-------------------------------------------------------|---------------|---------------------------|
@@ -973,186 +1180,33 @@ class RemehaApi:
             _LOGGER.info("Ignoring zone(zone_id=%d), because its type is NOT_PRESENT.", id)
             return None
 
-        zone_function = ClimateZoneFunction(
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.FUNCTION, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.FUNCTION,
-            )
-        )
-        zone_short_name = cast(
-            str,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.SHORT_NAME, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.SHORT_NAME,
-            ),
-        )
-        owning_device = cast(
-            int | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.OWNING_DEVICE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.OWNING_DEVICE,
-            ),
-        )
-        zone_mode = ClimateZoneMode(
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.MODE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.MODE,
-            )
-        )
-        temporary_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.TEMPORARY_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.TEMPORARY_SETPOINT,
-            ),
-        )
-        room_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_MANUAL_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.ROOM_MANUAL_SETPOINT,
-            ),
-        )
-        dhw_comfort_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_COMFORT_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.DHW_COMFORT_SETPOINT,
-            ),
-        )
-        dhw_reduced_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_REDUCED_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.DHW_REDUCED_SETPOINT,
-            ),
-        )
+        values = await self._async_read_variables(
+            variables=_ZONE_VARIABLES,
+            offset=zone_register_offset,
+            max_gap=MODBUS_MAX_ZONE_REGISTER_GAP,
+        )
+        zone_function = ClimateZoneFunction(values[ZoneRegisters.FUNCTION])
+        zone_short_name = cast(str, values[ZoneRegisters.SHORT_NAME])
+        owning_device = cast(int | None, values[ZoneRegisters.OWNING_DEVICE])
+        zone_mode = ClimateZoneMode(values[ZoneRegisters.MODE])
+        temporary_setpoint = cast(float | None, values[ZoneRegisters.TEMPORARY_SETPOINT])
+        room_setpoint = cast(float | None, values[ZoneRegisters.ROOM_MANUAL_SETPOINT])
+        dhw_comfort_setpoint = cast(float | None, values[ZoneRegisters.DHW_COMFORT_SETPOINT])
+        dhw_reduced_setpoint = cast(float | None, values[ZoneRegisters.DHW_REDUCED_SETPOINT])
         dhw_calorifier_hysteresis = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_CALORIFIER_HYSTERESIS,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.DHW_CALORIFIER_HYSTERESIS,
-            ),
-        )
-        end_time_temporary_override = cast(
-            bytes,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.END_TIME_MODE_CHANGE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.END_TIME_MODE_CHANGE,
-            ),
-        )
-        selected_schedule = cast(
-            int | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.SELECTED_TIME_PROGRAM,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.SELECTED_TIME_PROGRAM,
-            ),
-        )
-        room_temperature = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
-            ),
-        )
-        room_cooling_setpoint_1 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_1,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_1,
-            ),
-        )
-        room_cooling_setpoint_2 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_2,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_2,
-            ),
-        )
-        room_cooling_setpoint_3 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_3,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_3,
-            ),
-        )
-        room_cooling_setpoint_4 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_4,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_4,
-            ),
-        )
-        room_cooling_setpoint_5 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_5,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_5,
-            ),
-        )
-        heating_mode = from_registers(
-            registers=await self._async_read_registers(
-                variable=ZoneRegisters.CURRENT_HEATING_MODE, offset=zone_register_offset
-            ),
-            destination_variable=ZoneRegisters.CURRENT_HEATING_MODE,
-        )
-        pump_running = from_registers(
-            registers=await self._async_read_registers(
-                variable=ZoneRegisters.PUMP_RUNNING, offset=zone_register_offset
-            ),
-            destination_variable=ZoneRegisters.PUMP_RUNNING,
-        )
-        dhw_tank_temperature = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_TANK_TEMPERATURE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.DHW_TANK_TEMPERATURE,
-            ),
-        )
+            float | None, values[ZoneRegisters.DHW_CALORIFIER_HYSTERESIS]
+        )
+        end_time_temporary_override = cast(bytes, values[ZoneRegisters.END_TIME_MODE_CHANGE])
+        selected_schedule = cast(int | None, values[ZoneRegisters.SELECTED_TIME_PROGRAM])
+        room_temperature = cast(float | None, values[ZoneRegisters.CURRENT_ROOM_TEMPERATURE])
+        room_cooling_setpoint_1 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_1])
+        room_cooling_setpoint_2 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_2])
+        room_cooling_setpoint_3 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_3])
+        room_cooling_setpoint_4 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_4])
+        room_cooling_setpoint_5 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_5])
+        heating_mode = values[ZoneRegisters.CURRENT_HEATING_MODE]
+        pump_running = values[ZoneRegisters.PUMP_RUNNING]
+        dhw_tank_temperature = cast(float | None, values[ZoneRegisters.DHW_TANK_TEMPERATURE])
 
         # Map schedule_1 to schedule_4 if required.
         appliance_requires_cooling = appliance.is_cooling_required()
@@ -1188,7 +1242,7 @@ class RemehaApi:
             mode=zone_mode,
             temporary_setpoint=temporary_setpoint,
             selected_schedule=schedule_id,
-            heating_mode=None if heating_mode is None else ClimateZoneHeatingMode(heating_mode),
+            heating_mode=_to_optional_enum(ClimateZoneHeatingMode, heating_mode),
             room_setpoint=room_setpoint,
             dhw_comfort_setpoint=dhw_comfort_setpoint,
             dhw_reduced_setpoint=dhw_reduced_setpoint,
@@ -1211,14 +1265,19 @@ class RemehaApi:
             appliance_requires_cooling=appliance_requires_cooling,
         )
 
-    async def async_read_zone_update(self, zone: ClimateZone, appliance: Appliance) -> ClimateZone:
+    async def async_read_zone_update(
+        self, zone: ClimateZone, appliance: Appliance, read_schedules: bool = True
+    ) -> ClimateZone:
         """Retrieve updates for a single ClimateZone.
 
         In attempt to reduce the amount of calls over the network, this only reads updatable fields from modbus and
-        merges `zone` with the updates in a new returned `ClimateZone`. Only the base zone registers are mentioned
-        here; add `512 * id` to get the discrete register number of the zone.
+        merges `zone` with the updates in a new returned `ClimateZone`. Nearby registers are read in a single request.
+        Only the base zone registers are mentioned here; add `512 * id` to get the discrete register number of the zone.
         For details, refer to the Remeha GTW-08 parameter list.
 
+        Zone schedules only change on user action, so if `read_schedules` is `False`, the schedules of `zone`
+        are reused unless the zone mode or the selected schedule changed.
+
         | Base address  | Variable name                     | Description                                           | Modbus type   | HA type                   |
         |---------------|-----------------------------------|-------------------------------------------------------|---------------|---------------------------|
         |       649     | `parZoneMode`                     | Mode zone working.                                    |   `ENUM8`     | `ClimateZoneMode`         |
@@ -1241,6 +1300,7 @@ class RemehaApi:
         Args:
             zone (ClimateZone): The zone to update.
             appliance (Appliance): The appliance to which this zone belongs.
+            read_schedules (bool): Whether to re-read the zone schedules.
 
         Returns:
             `ClimateZone`: The updated zone.
@@ -1254,160 +1314,30 @@ class RemehaApi:
 
         zone_register_offset: int = self.get_zone_register_offset(zone)
 
-        zone_mode = ClimateZoneMode(
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.MODE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.MODE,
-            )
-        )
-        temporary_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.TEMPORARY_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.TEMPORARY_SETPOINT,
-            ),
-        )
-        room_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_MANUAL_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.ROOM_MANUAL_SETPOINT,
-            ),
-        )
-        dhw_comfort_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_COMFORT_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.DHW_COMFORT_SETPOINT,
-            ),
-        )
-        dhw_reduced_setpoint = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_REDUCED_SETPOINT, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.DHW_REDUCED_SETPOINT,
-            ),
+        values = await self._async_read_variables(
+            variables=_ZONE_UPDATE_VARIABLES,
+            offset=zone_register_offset,
+            max_gap=MODBUS_MAX_ZONE_REGISTER_GAP,
         )
+        zone_mode = ClimateZoneMode(values[ZoneRegisters.MODE])
+        temporary_setpoint = cast(float | None, values[ZoneRegisters.TEMPORARY_SETPOINT])
+        room_setpoint = cast(float | None, values[ZoneRegisters.ROOM_MANUAL_SETPOINT])
+        dhw_comfort_setpoint = cast(float | None, values[ZoneRegisters.DHW_COMFORT_SETPOINT])
+        dhw_reduced_setpoint = cast(float | None, values[ZoneRegisters.DHW_REDUCED_SETPOINT])
         dhw_calorifier_hysteresis = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_CALORIFIER_HYSTERESIS,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.DHW_CALORIFIER_HYSTERESIS,
-            ),
-        )
-        end_time_temporary_override = cast(
-            bytes,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.END_TIME_MODE_CHANGE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.END_TIME_MODE_CHANGE,
-            ),
-        )
-        selected_schedule = cast(
-            int | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.SELECTED_TIME_PROGRAM,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.SELECTED_TIME_PROGRAM,
-            ),
-        )
-        room_temperature = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
-            ),
-        )
-        room_cooling_setpoint_1 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_1,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_1,
-            ),
-        )
-        room_cooling_setpoint_2 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_2,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_2,
-            ),
-        )
-        room_cooling_setpoint_3 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_3,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_3,
-            ),
-        )
-        room_cooling_setpoint_4 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_4,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_4,
-            ),
-        )
-        room_cooling_setpoint_5 = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.ROOM_COOLING_SETPOINT_5,
-                    offset=zone_register_offset,
-                ),
-                destination_variable=ZoneRegisters.ROOM_COOLING_SETPOINT_5,
-            ),
-        )
-        heating_mode = from_registers(
-            registers=await self._async_read_registers(
-                variable=ZoneRegisters.CURRENT_HEATING_MODE, offset=zone_register_offset
-            ),
-            destination_variable=ZoneRegisters.CURRENT_HEATING_MODE,
-        )
-        pump_running = from_registers(
-            registers=await self._async_read_registers(
-                variable=ZoneRegisters.PUMP_RUNNING, offset=zone_register_offset
-            ),
-            destination_variable=ZoneRegisters.PUMP_RUNNING,
-        )
-        dhw_tank_temperature = cast(
-            float | None,
-            from_registers(
-                registers=await self._async_read_registers(
-                    variable=ZoneRegisters.DHW_TANK_TEMPERATURE, offset=zone_register_offset
-                ),
-                destination_variable=ZoneRegisters.DHW_TANK_TEMPERATURE,
-            ),
-        )
+            float | None, values[ZoneRegisters.DHW_CALORIFIER_HYSTERESIS]
+        )
+        end_time_temporary_override = cast(bytes, values[ZoneRegisters.END_TIME_MODE_CHANGE])
+        selected_schedule = cast(int | None, values[ZoneRegisters.SELECTED_TIME_PROGRAM])
+        room_temperature = cast(float | None, values[ZoneRegisters.CURRENT_ROOM_TEMPERATURE])
+        room_cooling_setpoint_1 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_1])
+        room_cooling_setpoint_2 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_2])
+        room_cooling_setpoint_3 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_3])
+        room_cooling_setpoint_4 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_4])
+        room_cooling_setpoint_5 = cast(float | None, values[ZoneRegisters.ROOM_COOLING_SETPOINT_5])
+        heating_mode = values[ZoneRegisters.CURRENT_HEATING_MODE]
+        pump_running = values[ZoneRegisters.PUMP_RUNNING]
+        dhw_tank_temperature = cast(float | None, values[ZoneRegisters.DHW_TANK_TEMPERATURE])
 
         # Map schedule_1 to schedule_4 if required.
         appliance_requires_cooling = appliance.is_cooling_required()
@@ -1415,18 +1345,21 @@ class RemehaApi:
             zone_mode, zone.function, appliance_requires_cooling, selected_schedule
         )
 
-        # Read zone schedules.
+        # Read zone schedules, unless the ones of the previous zone state are still current.
         current_schedule: dict[Weekday, ZoneSchedule | None] = {}
         try:
-            current_schedule = (
-                await self._async_read_schedules(
+            if (
+                not read_schedules
+                and zone_mode is zone.mode
+                and schedule_id is zone.selected_schedule
+            ):
+                current_schedule = dict(zone.current_schedule)
+            elif zone_mode is ClimateZoneMode.SCHEDULING and schedule_id is not None:
+                current_schedule = await self._async_read_schedules(
                     zone=zone.id,
                     zone_mode=zone_mode,
                     schedule_id=schedule_id,
                 )
-                if zone_mode is ClimateZoneMode.SCHEDULING and schedule_id is not None
-                else {}
-            )
         except ValueError as e:
             raise InvalidZoneSchedule(
                 zone=zone.id,
@@ -1435,16 +1368,12 @@ class RemehaApi:
             ) from e
 
         # Merge old and new zone.
-        return ClimateZone(
-            id=zone.id,
-            type=zone.type,
-            function=zone.function,
-            short_name=zone.short_name,
-            owning_device=zone.owning_device,
+        return replace(
+            zone,
             mode=zone_mode,
             temporary_setpoint=temporary_setpoint,
             selected_schedule=schedule_id,
-            heating_mode=(None if heating_mode is None else ClimateZoneHeatingMode(heating_mode)),
+            heating_mode=_to_optional_enum(ClimateZoneHeatingMode, heating_mode),
             room_setpoint=room_setpoint,
             room_cooling_setpoint_1=room_cooling_setpoint_1,
             room_cooling_setpoint_2=room_cooling_setpoint_2,
@@ -25,21 +25,27 @@ from .schedule import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_CENTRAL_HEATING_TYPES: frozenset[ClimateZoneType] = frozenset(
+    {ClimateZoneType.CH_ONLY, ClimateZoneType.CH_AND_COOLING}
+)
+
+_DOMESTIC_HOT_WATER_FUNCTIONS: frozenset[ClimateZoneFunction] = frozenset(
+    {
+        ClimateZoneFunction.DHW_BIC,
+        ClimateZoneFunction.DHW_COMMERCIAL_TANK,
+        ClimateZoneFunction.DHW_LAYERED,
+        ClimateZoneFunction.DHW_PRIMARY,
+        ClimateZoneFunction.DHW_TANK,
+        ClimateZoneFunction.ELECTRICAL_DHW_TANK,
+    }
+)
+
 
 def is_domestic_hot_water(type: ClimateZoneType, function: ClimateZoneFunction) -> bool:
     """Return whether the given type and function resolve to a DHW zone type."""
 
     return type == ClimateZoneType.DHW or (
-        type == ClimateZoneType.OTHER
-        and function
-        in [
-            ClimateZoneFunction.DHW_BIC,
-            ClimateZoneFunction.DHW_COMMERCIAL_TANK,
-            ClimateZoneFunction.DHW_LAYERED,
-            ClimateZoneFunction.DHW_PRIMARY,
-            ClimateZoneFunction.DHW_TANK,
-            ClimateZoneFunction.ELECTRICAL_DHW_TANK,
-        ]
+        type == ClimateZoneType.OTHER and function in _DOMESTIC_HOT_WATER_FUNCTIONS
     )
 
 
@@ -50,13 +56,12 @@ def is_central_heating(type: ClimateZoneType, function: ClimateZoneFunction) ->
     is available (yet).
     """
 
-    return type in [
-        ClimateZoneType.CH_ONLY,
-        ClimateZoneType.CH_AND_COOLING,
-    ] or (type == ClimateZoneType.OTHER and function == ClimateZoneFunction.MIXING_CIRCUIT)
+    return type in _CENTRAL_HEATING_TYPES or (
+        type == ClimateZoneType.OTHER and function == ClimateZoneFunction.MIXING_CIRCUIT
+    )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ClimateZone:
     """Defines a climate zone following the GTW-08 parameter list.
 
@@ -282,7 +287,7 @@ class ClimateZone:
             )
 
     @property
-    def current_temparature(self) -> float:
+    def current_temperature(self) -> float:
         """Return the current temperature of this zone.
 
         The actual returned temperature field depends on the type of zone.
@@ -369,4 +374,4 @@ class ClimateZone:
     def __hash__(self) -> int:
         """Return a hash of this zone."""
 
-        return hash(vars(self))
+        return hash((self.id, self.type, self.function))
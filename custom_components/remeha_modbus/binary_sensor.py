@@ -23,7 +23,7 @@ async def async_setup_entry(
 ) -> None:
     """Create the sensor entities based on the given config entry."""
 
-    coordinator: RemehaUpdateCoordinator = entry.runtime_data["coordinator"]
+    coordinator: RemehaUpdateCoordinator = entry.runtime_data.coordinator
     mainboards: list[DeviceInstance] = coordinator.get_devices(
         predicate=lambda device: device.is_mainboard()
     )
@@ -59,8 +59,8 @@ async def async_setup_entry(
 ) -> None:
     """Instantiate a new Remeha Modbus climate entity based on the given config entry."""
 
-    api: RemehaApi = entry.runtime_data["api"]
-    coordinator: RemehaUpdateCoordinator = entry.runtime_data["coordinator"]
+    api: RemehaApi = entry.runtime_data.api
+    coordinator: RemehaUpdateCoordinator = entry.runtime_data.coordinator
 
     entities = [
         RemehaClimateEntity.create_instance(api, coordinator, zone_id)
@@ -131,7 +131,7 @@ class RemehaClimateEntity(CoordinatorEntity, ClimateEntity):
     def current_temperature(self) -> float | None:
         """Return the current zone temperature."""
 
-        return self._zone.current_temparature
+        return self._zone.current_temperature
 
     @property
     def device_info(self) -> DeviceInfo | None:
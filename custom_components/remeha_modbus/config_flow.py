@@ -11,7 +11,7 @@ from homeassistant.config_entries import (
     ConfigFlow,
     ConfigFlowResult,
 )
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TYPE
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TIMEOUT, CONF_TYPE
 from homeassistant.data_entry_flow import section
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.selector import selector
@@ -30,7 +30,10 @@ from custom_components.remeha_modbus.const import (
     DOMAIN,
     HA_CONFIG_MINOR_VERSION,
     HA_CONFIG_VERSION,
+    MODBUS_DEFAULT_TIMEOUT,
     MODBUS_DEVICE_ADDRESS,
+    MODBUS_MAX_TIMEOUT,
+    MODBUS_MIN_TIMEOUT,
     MODBUS_SERIAL_BAUDRATE,
     MODBUS_SERIAL_BYTESIZE,
     MODBUS_SERIAL_METHOD,
@@ -229,6 +232,16 @@ def _modbus_socket_schema(current: ConfigEntry | None = None) -> vol.Schema:
             vol.Required(
                 CONF_PORT, default=current.data[CONF_PORT] if current else vol.UNDEFINED
             ): cv.port,
+            vol.Optional(
+                CONF_TIMEOUT,
+                default=(
+                    current.data.get(CONF_TIMEOUT, MODBUS_DEFAULT_TIMEOUT)
+                    if current
+                    else MODBUS_DEFAULT_TIMEOUT
+                ),
+            ): vol.All(
+                vol.Coerce(float), vol.Range(min=MODBUS_MIN_TIMEOUT, max=MODBUS_MAX_TIMEOUT)
+            ),
         }
     )
 
@@ -1,7 +1,7 @@
 """Constants for the Remeha Modbus integration."""
 
 from collections.abc import Callable
-from datetime import date
+from datetime import date, timedelta
 from enum import Enum, StrEnum
 from typing import Final, Literal, NamedTuple, Self
 
@@ -95,6 +95,46 @@ is much shorter, but it will cost more energy.
 """
 
 
+MODBUS_SETUP_CONNECT_TIMEOUT: Final[int] = 10
+"""The minimum amount of seconds to wait for the modbus connection while setting up an entry.
+
+Entries configured with a larger network timeout wait for that timeout instead.
+"""
+
+MODBUS_SETUP_HEALTH_CHECK_TIMEOUT: Final[int] = 10
+"""The minimum amount of seconds the health check may take while setting up an entry.
+
+Entries configured with a larger network timeout wait for all read attempts to time out instead.
+"""
+
+ZONE_SCHEDULE_REFRESH_INTERVAL: Final[timedelta] = timedelta(minutes=15)
+"""The interval at which unchanged zone schedules are re-read from the modbus device.
+
+Zone schedules only change on user action and are comparatively expensive to read,
+so they are refreshed less often than the other zone registers.
+"""
+
+MODBUS_RECONNECT_INTERVAL: Final[int] = 10
+"""The minimum amount of seconds between reconnect attempts after reconnecting failed."""
+
+MODBUS_DEFAULT_TIMEOUT: Final[float] = 5.0
+"""The default amount of seconds to wait for a response of a modbus device on the network."""
+
+MODBUS_MIN_TIMEOUT: Final[float] = 0.1
+"""The minimum configurable modbus network timeout in seconds."""
+
+MODBUS_MAX_TIMEOUT: Final[float] = 120.0
+"""The maximum configurable modbus network timeout in seconds."""
+
+MODBUS_READ_ATTEMPTS: Final[int] = 3
+"""The amount of times `RemehaApi` attempts to read registers before giving up."""
+
+MODBUS_CLIENT_RETRIES: Final[int] = 0
+"""The amount of times the modbus client itself retries a request that got no response.
+
+Failed reads are already retried by `RemehaApi`, so the client does not retry them again.
+"""
+
 PV_MIN_TILT_DEGREES: Final[int] = 10
 """The minimum supported PV system tilt"""
 
@@ -423,17 +463,22 @@ class ClimateZoneFunction(Enum):
 
     def is_supported(self) -> bool:
         """Return whether this `ClimateZoneFunction` is currently supported within this integration."""
-        return self in [
-            ClimateZoneFunction.MIXING_CIRCUIT,
-            ClimateZoneFunction.DHW_PRIMARY,
-        ]
+        return self in _SUPPORTED_ZONE_FUNCTIONS
 
     def has_cooling_capability(self) -> bool:
         """Return whether this `ClimateZoneFunction` supports cooling."""
-        return self in [
-            ClimateZoneFunction.MIXING_CIRCUIT,
-            ClimateZoneFunction.FAN_CONVECTOR,
-        ]
+        return self in _COOLING_ZONE_FUNCTIONS
+
+
+_SUPPORTED_ZONE_FUNCTIONS: Final[frozenset[ClimateZoneFunction]] = frozenset(
+    {ClimateZoneFunction.MIXING_CIRCUIT, ClimateZoneFunction.DHW_PRIMARY}
+)
+"""The zone functions that are supported within this integration."""
+
+_COOLING_ZONE_FUNCTIONS: Final[frozenset[ClimateZoneFunction]] = frozenset(
+    {ClimateZoneFunction.MIXING_CIRCUIT, ClimateZoneFunction.FAN_CONVECTOR}
+)
+"""The zone functions that are capable of cooling."""
 
 
 class ClimateZoneMode(Enum):
@@ -667,6 +712,20 @@ class Limits(float, Enum):
     """The maximum allowed hysteresis."""
 
 
+# Modbus allows reading at most 125 holding registers in a single request.
+MODBUS_MAX_READ_REGISTERS: Final[int] = 125
+
+# The maximum amount of unused registers to read along when merging reads of nearby variables.
+MODBUS_MAX_REGISTER_GAP: Final[int] = 4
+
+# The maximum register gap for zone reads, so the zone parameters (649-688) and zone variables
+# (1104-1119) are each read in a single request. Devices rejecting the registers in between get
+# the affected blocks read per variable instead.
+MODBUS_MAX_ZONE_REGISTER_GAP: Final[int] = 20
+
+# The modbus exception code a device returns when a request includes registers it doesn't define.
+MODBUS_ILLEGAL_DATA_ADDRESS: Final[int] = 0x02
+
 # Base register information for zones, device info, time schedules
 REMEHA_ZONE_RESERVED_REGISTERS: Final[int] = 512
 REMEHA_DEVICE_INSTANCE_RESERVED_REGISTERS: Final[int] = 6
@@ -1,8 +1,10 @@
 """Coordinator for fetching modbus data of Remeha devices."""
 
+import asyncio
 import logging
 from collections.abc import Callable
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Any, cast
 from uuid import UUID
 
@@ -13,6 +15,7 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pymodbus import ModbusException
 
 from custom_components.remeha_modbus.api import (
@@ -23,6 +26,7 @@ from custom_components.remeha_modbus.api.appliance import Appliance
 from custom_components.remeha_modbus.api.climate_zone import ClimateZone, ZoneSchedule
 from custom_components.remeha_modbus.api.schedule import HourlyForecast, WeatherForecast
 from custom_components.remeha_modbus.api.store import RemehaModbusStorage, WaitingListEntry
+from custom_components.remeha_modbus.blend.blender import Blender
 from custom_components.remeha_modbus.blend.scheduler.const import SchedulerLinkView, ZoneScheduleUID
 from custom_components.remeha_modbus.blend.scheduler.helpers import get_updated_dhw_schedules
 from custom_components.remeha_modbus.const import (
@@ -45,6 +49,7 @@ from custom_components.remeha_modbus.const import (
     PV_TILT,
     REMEHA_SENSORS,
     WEEKDAY_TO_MODBUS_VARIABLE,
+    ZONE_SCHEDULE_REFRESH_INTERVAL,
     BoilerConfiguration,
     BoilerEnergyLabel,
     ClimateZoneScheduleId,
@@ -149,6 +154,9 @@ class RemehaUpdateCoordinator(DataUpdateCoordinator):
 
         self._schedule_subscribers: set[Subscriber[ZoneSchedule]] = set()
 
+        # Zone schedules are refreshed at a lower rate than the other zone registers.
+        self._schedules_refreshed_at: datetime | None = None
+
     def _is_before_first_update(self) -> bool:
         return not self.data or "climates" not in self.data
 
@@ -169,16 +177,29 @@ class RemehaUpdateCoordinator(DataUpdateCoordinator):
     ]:
         try:
             before_first_update = self._is_before_first_update()
+            now = dt_util.utcnow()
+            read_schedules = (
+                before_first_update
+                or self._schedules_refreshed_at is None
+                or now - self._schedules_refreshed_at >= ZONE_SCHEDULE_REFRESH_INTERVAL
+            )
             zones: list[ClimateZone] = []
             appliance: Appliance = await self._api.async_read_appliance()
             sensors = await self._api.async_read_sensor_values(list(REMEHA_SENSORS.keys()))
             if before_first_update:
                 zones = await self._api.async_read_zones(appliance)
             else:
-                zones = [
-                    await self._api.async_read_zone_update(zone, appliance)
-                    for zone in list(self.data["climates"].values())
-                ]
+                zones = list(
+                    await asyncio.gather(
+                        *(
+                            self._api.async_read_zone_update(zone, appliance, read_schedules)
+                            for zone in list(self.data["climates"].values())
+                        )
+                    )
+                )
+
+            if read_schedules:
+                self._schedules_refreshed_at = now
 
             # Fire an event for each updated ZoneSchedule, but only after the
             # initial refresh.
@@ -631,3 +652,17 @@ class RemehaUpdateCoordinator(DataUpdateCoordinator):
 
         await self._api.async_close()
         return await super().async_shutdown()
+
+
+@dataclass(slots=True)
+class RemehaRuntimeData:
+    """Runtime data of a Remeha Modbus config entry."""
+
+    api: RemehaApi
+    """The api used to communicate with the modbus device."""
+
+    coordinator: RemehaUpdateCoordinator
+    """The coordinator that retrieves the modbus data."""
+
+    blenders: dict[str, Blender]
+    """The blenders that integrate with other integrations, keyed by name."""
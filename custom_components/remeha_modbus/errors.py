@@ -50,6 +50,18 @@ class MissingExternalComponent(RemehaModbusError):
     """Exception to indicate that a component is missing which is required for some action."""
 
 
+class ModbusExceptionResponseError(ModbusException):
+    """Exception to indicate the modbus device answered a request with an exception response.
+
+    The modbus exception code, for example 2 (illegal data address), is available as `exception_code`.
+    """
+
+    def __init__(self, message: str, exception_code: int) -> None:
+        """Create a new `ModbusExceptionResponseError`."""
+        super().__init__(message)
+        self.exception_code = exception_code
+
+
 class DiscoveryTableCorruptedError(ModbusException):
     """Exception to indicate the modbus discovery table seems corrupted.
 
@@ -1,11 +1,19 @@
 """Modbus helper functions."""
 
 import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import cache
 from typing import Any, Final, cast
 
 from pymodbus.client.mixin import ModbusClientMixin
 
-from custom_components.remeha_modbus.const import DataType, ModbusVariableDescription
+from custom_components.remeha_modbus.const import (
+    MODBUS_MAX_READ_REGISTERS,
+    MODBUS_MAX_REGISTER_GAP,
+    DataType,
+    ModbusVariableDescription,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +44,43 @@ HA_TO_PYMODBUS_TYPE: Final[dict[DataType, ModbusClientMixin.DATATYPE]] = {
 
 type ModbusPrimitive = int | float | str | list[bool] | list[int] | list[float]
 
+_BYTES_DATA_TYPES: Final[frozenset[DataType]] = frozenset(
+    {DataType.CIA_301_TIME_OF_DAY, DataType.ZONE_TIME_PROGRAM}
+)
+"""Data types that are deserialized to raw bytes instead of a `ModbusPrimitive`."""
+
+
+def _decode_uint16(registers: list[int]) -> int:
+    return registers[0]
+
+
+def _decode_int16(registers: list[int]) -> int:
+    value: int = registers[0]
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def _decode_uint32(registers: list[int]) -> int:
+    return registers[0] << 16 | registers[1]
+
+
+def _decode_int32(registers: list[int]) -> int:
+    value: int = registers[0] << 16 | registers[1]
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+_INTEGER_DECODERS: Final[dict[DataType, Callable[[list[int]], int]]] = {
+    DataType.INT16: _decode_int16,
+    DataType.INT32: _decode_int32,
+    DataType.UINT8: _decode_uint16,
+    DataType.UINT16: _decode_uint16,
+    DataType.UINT32: _decode_uint32,
+    DataType.TUPLE16: _decode_uint16,
+}
+"""Big-endian decoders for the integer data types most registers use.
+
+These produce the same values as `ModbusClientMixin.convert_from_registers`, without its `struct` round trip.
+"""
+
 
 def _is_gtw08_null_value(variable: ModbusVariableDescription, val: ModbusPrimitive | bytes) -> bool:
     return (
@@ -51,21 +96,25 @@ def to_gtw08_null_value(data_type: DataType) -> int | bytes | None:
 def _from_registers(
     variable: ModbusVariableDescription, registers: list[int]
 ) -> ModbusPrimitive | bytes | tuple[int, int] | None:
-    # If variable requires a bytes result, use our own conversion since the ModbusClientMixin doesn't support them.
-    val = (
-        bytes_from_registers(registers=registers)
-        if variable.data_type in [DataType.CIA_301_TIME_OF_DAY, DataType.ZONE_TIME_PROGRAM]
-        else ModbusClientMixin.convert_from_registers(
+    val: ModbusPrimitive | bytes
+    decoder = _INTEGER_DECODERS.get(variable.data_type)
+    if decoder is not None:
+        val = decoder(registers)
+    elif variable.data_type in _BYTES_DATA_TYPES:
+        # If variable requires a bytes result, use our own conversion since the ModbusClientMixin doesn't support them.
+        val = bytes_from_registers(registers=registers)
+    else:
+        val = ModbusClientMixin.convert_from_registers(
             registers=registers, data_type=HA_TO_PYMODBUS_TYPE[variable.data_type]
         )
-    )
 
     # Post-process
     if _is_gtw08_null_value(variable=variable, val=val):
         return None
     if variable.data_type == DataType.TUPLE16:
-        temp = int(cast(Any, val)).to_bytes(2)
-        return (temp[0], temp[1])
+        # High byte first, e.g. 0x2001 becomes (0x20, 0x01).
+        temp = int(cast(Any, val))
+        return (temp >> 8, temp & 0xFF)
     if variable.data_type == DataType.UINT8:
         # Ignore the first byte to get a clean uint8
         val = int(cast(Any, val)) & int("00ff", 16)
@@ -200,3 +249,104 @@ def bytes_from_registers(registers: list[int]) -> bytes:
     """Return the raw bytes from the given list of registers."""
 
     return b"".join([x.to_bytes(2) for x in registers])
+
+
+@dataclass(frozen=True)
+class RegisterBlock:
+    """A contiguous range of registers containing one or more variables, read in a single request."""
+
+    start_address: int
+    """The address of the first register in the block."""
+
+    count: int
+    """The amount of registers in the block."""
+
+    variables: tuple[ModbusVariableDescription, ...]
+    """The variables located in the block, ordered by their start address."""
+
+
+@cache
+def _plan_register_blocks(
+    variables: tuple[ModbusVariableDescription, ...], max_gap: int, max_count: int
+) -> tuple[RegisterBlock, ...]:
+    blocks: list[RegisterBlock] = []
+    members: list[ModbusVariableDescription] = []
+    start: int = 0
+    end: int = 0
+    for variable in sorted(set(variables), key=lambda v: v.start_address):
+        variable_end = variable.start_address + cast(int, variable.count)
+        if members and (
+            variable.start_address - end > max_gap or max(end, variable_end) - start > max_count
+        ):
+            blocks.append(RegisterBlock(start, end - start, tuple(members)))
+            members = []
+
+        if not members:
+            start, end = variable.start_address, variable_end
+        else:
+            end = max(end, variable_end)
+
+        members.append(variable)
+
+    if members:
+        blocks.append(RegisterBlock(start, end - start, tuple(members)))
+
+    return tuple(blocks)
+
+
+def plan_register_blocks(
+    variables: Iterable[ModbusVariableDescription],
+    max_gap: int = MODBUS_MAX_REGISTER_GAP,
+    max_count: int = MODBUS_MAX_READ_REGISTERS,
+) -> tuple[RegisterBlock, ...]:
+    """Group `variables` into as few contiguous register blocks as possible.
+
+    Variables are merged into the same block if at most `max_gap` unused registers separate them
+    and the block does not exceed `max_count` registers. Since the register map is fixed, plans
+    are cached per distinct set of variables.
+
+    Args:
+        variables (Iterable[ModbusVariableDescription]): The variables to plan the reads for.
+        max_gap (int): The maximum amount of unused registers to read in between two variables.
+        max_count (int): The maximum amount of registers in a single block.
+
+    Returns:
+        `tuple[RegisterBlock, ...]`: The register blocks, ordered by start address.
+
+    """
+
+    return _plan_register_blocks(tuple(variables), max_gap, max_count)
+
+
+def from_register_block(
+    block: RegisterBlock, registers: list[int]
+) -> dict[ModbusVariableDescription, ModbusPrimitive | bytes | tuple[int, int] | None]:
+    """Deserialize all variables in `block` from the registers read for it.
+
+    Args:
+        block (RegisterBlock): The block the registers have been read for.
+        registers (list[int]): The registers of the block, starting at `block.start_address`.
+
+    Returns:
+        `dict[ModbusVariableDescription, ...]`: A mapping from each variable in `block` to its value.
+
+    Raises:
+        ValueError: If `registers` does not contain exactly `block.count` registers, or if a variable
+            cannot be deserialized.
+
+    """
+
+    if len(registers) != block.count:
+        raise ValueError(
+            f"Got {len(registers)} registers, but the register block requires {block.count}."
+        )
+
+    values: dict[ModbusVariableDescription, ModbusPrimitive | bytes | tuple[int, int] | None] = {}
+    for variable in block.variables:
+        first: int = variable.start_address - block.start_address
+        values[variable] = from_registers(
+            registers=registers[first : first + cast(int, variable.count)],
+            destination_variable=variable,
+        )
+
+    return values
@@ -29,8 +29,8 @@ async def async_setup_entry(
 ) -> None:
     """Add all Remeha Modbus number entities based on the given config entry."""
 
-    api: RemehaApi = entry.runtime_data["api"]
-    coordinator: RemehaUpdateCoordinator = entry.runtime_data["coordinator"]
+    api: RemehaApi = entry.runtime_data.api
+    coordinator: RemehaUpdateCoordinator = entry.runtime_data.coordinator
 
     entities: list[NumberEntity] = []
 
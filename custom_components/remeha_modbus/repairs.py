@@ -93,7 +93,7 @@ class InvalidZoneScheduleFixFlow(RepairsFlow):
                 assert isinstance(is_dhw, bool)
 
                 config_entry = next(iter(self.hass.config_entries.async_entries(DOMAIN)))
-                coordinator: RemehaUpdateCoordinator = config_entry.runtime_data["coordinator"]
+                coordinator: RemehaUpdateCoordinator = config_entry.runtime_data.coordinator
 
                 # Don't use an HA service here, because that would require an entity_id.
                 # If this issue occurs during the first data fetch, no entities are available yet.
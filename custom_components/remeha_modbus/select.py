@@ -24,8 +24,8 @@ async def async_setup_entry(
 ) -> None:
     """Create the select entities based on the given config entry."""
 
-    api: RemehaApi = entry.runtime_data["api"]
-    coordinator: RemehaUpdateCoordinator = entry.runtime_data["coordinator"]
+    api: RemehaApi = entry.runtime_data.api
+    coordinator: RemehaUpdateCoordinator = entry.runtime_data.coordinator
     mainboards: list[DeviceInstance] = coordinator.get_devices(
         predicate=lambda device: device.is_mainboard()
     )
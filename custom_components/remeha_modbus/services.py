@@ -112,12 +112,12 @@ def register_services(  # noqa: C901
         try:
             scheduler_blender = SchedulerBlender(
                 hass=hass,
-                coordinator=config.runtime_data["coordinator"],
+                coordinator=config.runtime_data.coordinator,
                 dispatcher=SchedulerEventDispatcher(hass=hass),
             )
             await scheduler_blender.async_blend()
 
-            config.runtime_data["blenders"]["scheduler"] = scheduler_blender
+            config.runtime_data.blenders["scheduler"] = scheduler_blender
 
         except MissingExternalComponent as e:
             # If the scheduler integration is not installed but schedule sync
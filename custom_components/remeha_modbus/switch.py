@@ -42,8 +42,8 @@ async def async_setup_entry(
 ) -> None:
     """Create the switch entities based on the given config entry."""
 
-    api: RemehaApi = entry.runtime_data["api"]
-    coordinator: RemehaUpdateCoordinator = entry.runtime_data["coordinator"]
+    api: RemehaApi = entry.runtime_data.api
+    coordinator: RemehaUpdateCoordinator = entry.runtime_data.coordinator
     mainboards: list[DeviceInstance] = coordinator.get_devices(lambda device: device.is_mainboard())
     parent_device_id: int | None = mainboards[0].id if mainboards else None
 
@@ -153,7 +153,7 @@ class RemehaHeatpumpManagedSchedulesSwitch(RemehaModbusSwitch):
         """
 
         prev_presets: dict[str, str] = {}
-        coordinator: RemehaUpdateCoordinator = self._config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = self._config_entry.runtime_data.coordinator
         for climate in coordinator.get_climates(lambda c: c.is_domestic_hot_water()):
             entity_id = get_climate_entity_id(self.hass, climate)
             state = self.hass.states.get(entity_id)
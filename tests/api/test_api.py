@@ -1,13 +1,17 @@
 """Tests for RemehaApi."""
 
 from datetime import datetime, time
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TIMEOUT, CONF_TYPE
 from pymodbus import ModbusException
 
 from custom_components.remeha_modbus.api import (
     ConnectionType,
     DeviceInstance,
+    RemehaApi,
 )
 from custom_components.remeha_modbus.api.appliance import (
     Appliance,
@@ -24,7 +28,10 @@ from custom_components.remeha_modbus.api.schedule import (
     ZoneSchedule,
 )
 from custom_components.remeha_modbus.const import (
+    MODBUS_DEVICE_ADDRESS,
+    MODBUS_ILLEGAL_DATA_ADDRESS,
     REMEHA_SENSORS,
+    WEEKDAY_TO_MODBUS_VARIABLE,
     ClimateZoneFunction,
     ClimateZoneHeatingMode,
     ClimateZoneMode,
@@ -37,7 +44,10 @@ from custom_components.remeha_modbus.const import (
     ZoneRegisters,
 )
 from custom_components.remeha_modbus.errors import DiscoveryTableCorruptedError
-from custom_components.remeha_modbus.helpers.modbus import to_gtw08_null_value
+from custom_components.remeha_modbus.helpers.modbus import (
+    plan_register_blocks,
+    to_gtw08_null_value,
+)
 from tests.conftest import get_api
 
 
@@ -76,7 +86,7 @@ async def test_api_properties(mock_modbus_client):
     api = get_api(mock_modbus_client=mock_modbus_client, name="remeha_modbus_hub")
     assert api.name == "remeha_modbus_hub"
     assert api.connection_type == ConnectionType.RTU_OVER_TCP
-    assert await api.async_is_connected  # Always True for mocked api
+    assert api.is_connected  # Always True for mocked api
 
 
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
@@ -90,6 +100,56 @@ async def test_api_connection(mock_modbus_client):
         await api.async_close()
 
 
+async def test_api_shares_network_client():
+    """Test that entries connecting to the same gateway share a single modbus client."""
+
+    def _config(device_address: int) -> MappingProxyType:
+        return MappingProxyType(
+            {
+                CONF_TYPE: ConnectionType.TCP,
+                CONF_HOST: "gateway.local",
+                CONF_PORT: "502",
+                MODBUS_DEVICE_ADDRESS: device_address,
+            }
+        )
+
+    with patch("custom_components.remeha_modbus.api.api.AsyncModbusTcpClient") as client_type:
+        first = RemehaApi.create(name="first", config=_config(device_address=1))
+        second = RemehaApi.create(name="second", config=_config(device_address=2))
+        assert client_type.call_count == 1
+
+        # The shared client must stay open until the last api releases it.
+        await first.async_close()
+        client_type.return_value.close.assert_not_called()
+
+        await second.async_close()
+        client_type.return_value.close.assert_called_once()
+
+
+async def test_api_does_not_share_client_with_other_timeout():
+    """Test that entries with different timeouts for the same gateway use separate clients."""
+
+    def _config(timeout: float) -> MappingProxyType:
+        return MappingProxyType(
+            {
+                CONF_TYPE: ConnectionType.TCP,
+                CONF_HOST: "gateway.local",
+                CONF_PORT: "502",
+                CONF_TIMEOUT: timeout,
+                MODBUS_DEVICE_ADDRESS: 1,
+            }
+        )
+
+    with patch("custom_components.remeha_modbus.api.api.AsyncModbusTcpClient") as client_type:
+        first = RemehaApi.create(name="first", config=_config(timeout=5.0))
+        second = RemehaApi.create(name="second", config=_config(timeout=10.0))
+        assert client_type.call_count == 2
+
+        await first.async_close()
+        await second.async_close()
+        assert client_type.return_value.close.call_count == 2
+
+
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
 async def test_read_single_variable(mock_modbus_client):
     """Test that the API can be created and a single register be read."""
@@ -103,7 +163,11 @@ async def test_read_device_instance(mock_modbus_client):
     """Test that a device can be read through the modbus interface."""
 
     api = get_api(mock_modbus_client=mock_modbus_client)
+    mock_modbus_client.read_holding_registers.reset_mock()
     device = await api.async_read_device_instance(0)
+
+    # All device instance registers are read in a single request.
+    assert mock_modbus_client.read_holding_registers.call_count == 1
     assert device is not None
     assert device.id == 0
     assert device.hw_version == (2, 1)
@@ -112,6 +176,19 @@ async def test_read_device_instance(mock_modbus_client):
     assert device.article_number == 7853960
 
 
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_read_appliance_in_blocks(mock_modbus_client):
+    """Test that the appliance status registers are read in blocks."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    mock_modbus_client.read_holding_registers.reset_mock()
+    appliance = await api.async_read_appliance()
+
+    # The appliance registers are located in four groups: 275-280, 385-389, 490-492 and 500-503.
+    assert mock_modbus_client.read_holding_registers.call_count == 4
+    assert appliance is not None
+
+
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
 async def test_read_device_instances(mock_modbus_client):
     """Read all devices through the modbus interface."""
@@ -171,6 +248,74 @@ async def test_read_sensor_values(mock_modbus_client):
     )
 
 
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_read_sensor_values_merges_requests(mock_modbus_client):
+    """Test that nearby sensor variables are read in a single request."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    descriptions = list(REMEHA_SENSORS.keys())
+
+    mock_modbus_client.read_holding_registers.reset_mock()
+    values = await api.async_read_sensor_values(descriptions=descriptions)
+
+    assert list(values.keys()) == descriptions
+    assert mock_modbus_client.read_holding_registers.call_count == len(
+        plan_register_blocks(descriptions)
+    )
+    assert mock_modbus_client.read_holding_registers.call_count < len(descriptions)
+
+
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_read_sensor_values_split_rejected_requests(mock_modbus_client):
+    """Test that variables are read separately if the device rejects reading them in a single request."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    descriptions = list(REMEHA_SENSORS.keys())
+    expected = await api.async_read_sensor_values(descriptions=descriptions)
+
+    original_side_effect = mock_modbus_client.read_holding_registers.side_effect
+
+    async def reject_large_requests(*args, **kwargs):
+        if kwargs["count"] > 2:
+            return Mock(isError=Mock(return_value=True), exception_code=MODBUS_ILLEGAL_DATA_ADDRESS)
+        return await original_side_effect(*args, **kwargs)
+
+    mock_modbus_client.read_holding_registers.side_effect = reject_large_requests
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    assert await api.async_read_sensor_values(descriptions=descriptions) == expected
+
+    # Rejected requests are not attempted again.
+    mock_modbus_client.read_holding_registers.reset_mock()
+    assert await api.async_read_sensor_values(descriptions=descriptions) == expected
+    assert all(
+        call.kwargs["count"] <= 2
+        for call in mock_modbus_client.read_holding_registers.call_args_list
+    )
+
+
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_read_sensor_values_transient_error_does_not_split(mock_modbus_client):
+    """Test that blocks are not split after a transient error, like a missing reply."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    descriptions = list(REMEHA_SENSORS.keys())
+    original_side_effect = mock_modbus_client.read_holding_registers.side_effect
+
+    async def time_out(*args, **kwargs):
+        raise ModbusException("No response received after 0 retries")
+
+    mock_modbus_client.read_holding_registers.side_effect = time_out
+    with pytest.raises(ModbusException):
+        await api.async_read_sensor_values(descriptions=descriptions)
+
+    # After the gateway recovers, the sensors are read in blocks again.
+    mock_modbus_client.read_holding_registers.side_effect = original_side_effect
+    mock_modbus_client.read_holding_registers.reset_mock()
+    await api.async_read_sensor_values(descriptions=descriptions)
+    assert mock_modbus_client.read_holding_registers.call_count < len(descriptions)
+
+
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
 async def test_read_zone(mock_modbus_client):
     """Read a single zone."""
@@ -182,7 +327,7 @@ async def test_read_zone(mock_modbus_client):
 
     assert zone is not None
     assert zone.current_setpoint == 20.0
-    assert zone.current_temparature == 23.2
+    assert zone.current_temperature == 23.2
     assert zone.dhw_calorifier_hysteresis is None
     assert zone.dhw_comfort_setpoint is None
     assert zone.dhw_reduced_setpoint is None
@@ -243,6 +388,89 @@ async def test_read_zone_update(mock_modbus_client):
     assert updated_zone.current_setpoint == new_setpoint
 
 
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_read_zone_update_reuses_schedules(mock_modbus_client):
+    """Test that a zone update can skip re-reading the zone schedules."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    appliance = await api.async_read_appliance()
+
+    zone: ClimateZone | None = await api.async_read_zone(2, appliance)
+    assert zone is not None
+    assert zone.selected_schedule is not None
+    assert zone.current_schedule
+
+    mock_modbus_client.read_holding_registers.reset_mock()
+    updated_zone = await api.async_read_zone_update(zone, appliance, read_schedules=False)
+    assert updated_zone.current_schedule == zone.current_schedule
+
+    # Zone parameters (649-688), the mode change end time (978-980) and zone variables (1104-1119).
+    assert mock_modbus_client.read_holding_registers.call_count == 3
+
+    schedule_offset = api.get_zone_register_offset(zone) + api.get_schedule_register_offset(
+        zone.selected_schedule
+    )
+    read_addresses = {
+        call.kwargs["address"] for call in mock_modbus_client.read_holding_registers.call_args_list
+    }
+    assert (
+        not {
+            variable.start_address + schedule_offset
+            for variable in WEEKDAY_TO_MODBUS_VARIABLE.values()
+        }
+        & read_addresses
+    )
+
+
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_reconnect_is_throttled(mock_modbus_client):
+    """Test that a failed reconnect is not retried by every following request."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    mock_modbus_client.connected = False
+    mock_modbus_client.connect = AsyncMock(return_value=False)
+
+    with pytest.raises(ModbusException):
+        await api.async_read_number_of_zones()
+
+    with pytest.raises(ModbusException):
+        await api.async_read_number_of_zones()
+
+    assert mock_modbus_client.connect.await_count == 1
+
+
+async def test_reconnect_throttle_is_shared_by_pooled_clients():
+    """Test that a failed reconnect throttles all entries sharing the same modbus client."""
+
+    config = MappingProxyType(
+        {
+            CONF_TYPE: ConnectionType.TCP,
+            CONF_HOST: "gateway.local",
+            CONF_PORT: "502",
+            MODBUS_DEVICE_ADDRESS: 1,
+        }
+    )
+
+    with patch("custom_components.remeha_modbus.api.api.AsyncModbusTcpClient") as client_type:
+        client_type.return_value.connected = False
+        client_type.return_value.connect = AsyncMock(return_value=False)
+
+        first = RemehaApi.create(name="first", config=config)
+        second = RemehaApi.create(name="second", config=config)
+        try:
+            with pytest.raises(ModbusException):
+                await first.async_read_number_of_zones()
+
+            # The second entry uses the same gateway, so it must not reconnect right away either.
+            with pytest.raises(ModbusException):
+                await second.async_read_number_of_zones()
+
+            assert client_type.return_value.connect.await_count == 1
+        finally:
+            await first.async_close()
+            await second.async_close()
+
+
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
 async def test_health_check(mock_modbus_client):
     """Test a health check can be run without raising an exception."""
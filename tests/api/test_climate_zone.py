@@ -255,10 +255,10 @@ async def test_climate_zone_get_current_temperature(mock_modbus_client):
     assert zone is not None
 
     assert zone.is_domestic_hot_water()
-    assert zone.current_temparature == 53.2
+    assert zone.current_temperature == 53.2
 
     zone.type = ClimateZoneType.SWIMMING_POOL
-    assert zone.current_temparature == -1
+    assert zone.current_temperature == -1
 
 
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
@@ -273,6 +273,10 @@ async def test_climate_zone_equality(mock_modbus_client):
     assert zones[0] == zones[0]
     assert zones[1] == zones[1]
 
+    # Equal zones must have equal hashes.
+    zones_reread: list[ClimateZone] = await api.async_read_zones(await api.async_read_appliance())
+    assert {*zones, *zones_reread} == set(zones)
+
 
 @pytest.mark.parametrize("mock_modbus_client", ["modbus_store_ch_scheduling.json"], indirect=True)
 async def test_scheduling_temporary_setpoint(mock_modbus_client):
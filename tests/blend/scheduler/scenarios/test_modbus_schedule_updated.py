@@ -44,7 +44,7 @@ async def test_schedule_updated(
             mock_config_entry=mock_config_entry, scheduler_storage=scheduler_storage
         )
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         climate: ClimateZone | None = coordinator.get_climate(id=2)
         assert climate is not None
 
@@ -40,7 +40,7 @@ async def test_schedule_added_no_tags(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
         schedule_state_tracked = [False]
 
@@ -81,7 +81,7 @@ async def test_schedule_added_not_on_waiting_list(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
         schedule_state_tracked = [False]
 
@@ -131,7 +131,7 @@ async def test_schedule_added(
         # HA is set up, patch the async_get_registry mock
 
         zone_uid = ZoneScheduleUID(2, ClimateZoneScheduleId.SCHEDULE_1, Weekday.MONDAY)
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
 
         # Prepare waiting list.
         coordinator.enqueue_for_linking(uuid, zone_uid)
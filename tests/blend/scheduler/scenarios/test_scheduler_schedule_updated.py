@@ -37,7 +37,7 @@ async def test_schedule_updated_not_on_waiting_list(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         scenario = SchedulerScheduleUpdated(
@@ -75,7 +75,7 @@ async def test_schedule_updated_not_linked(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         scenario = SchedulerScheduleUpdated(
@@ -116,7 +116,7 @@ async def test_schedule_updated_missing_climate(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         # Create a UID for zone 99 which doesn't exist
@@ -164,7 +164,7 @@ async def test_schedule_updated_successfully(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         # Get the actual DHW zone (zone 2 based on fixture)
@@ -216,7 +216,7 @@ async def test_schedule_updated_calls_async_write_schedule_with_correct_data(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         climate = coordinator.get_climate(id=2)
@@ -270,7 +270,7 @@ async def test_init_with_none_state(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
 
         with pytest.raises(ScenarioExecutionError) as exc_info:
             SchedulerScheduleUpdated(
@@ -305,7 +305,7 @@ async def test_schedule_modbus_sourced_update_is_ignored(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         scenario = SchedulerScheduleUpdated(
@@ -359,7 +359,7 @@ async def test_schedule_updated_on_waiting_list_removes_from_list(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         scheduler_state = State(**json_fixture)
 
         scenario = SchedulerScheduleUpdated(
@@ -26,7 +26,7 @@ async def test_blender_creation(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         dispatcher = EventDispatcher(hass)
 
         blender = SchedulerBlender(hass, coordinator, dispatcher)
@@ -49,7 +49,7 @@ async def test_blender_async_blend(
         await setup_platform(hass=hass, config_entry=mock_config_entry)
         await hass.async_block_till_done()
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         dispatcher = EventDispatcher(hass)
         finalizer.append(dispatcher.untrack_all)
 
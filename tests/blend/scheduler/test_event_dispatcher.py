@@ -62,7 +62,7 @@ async def test_entity_update_listener_gets_called(
 
         unsub = dispatcher.track_updated_entities(entity_id=entity_id, listener=_dhw_listener)
 
-        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data["coordinator"]
+        coordinator: RemehaUpdateCoordinator = mock_config_entry.runtime_data.coordinator
         dhw_zone = coordinator.get_climate(id=2)
         assert dhw_zone is not None
         assert dhw_zone.current_setpoint is not None
@@ -18,7 +18,7 @@ from homeassistant.components.weather import (
 )
 from homeassistant.components.weather.const import DOMAIN as WeatherDomain
 from homeassistant.components.weather.const import WeatherEntityFeature
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TYPE
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TIMEOUT, CONF_TYPE
 from homeassistant.core import HomeAssistant, SupportsResponse
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_component import EntityComponent
@@ -166,8 +166,10 @@ def mock_modbus_client(request) -> Generator[AsyncMock]:
         )
 
         def get_registers(address: int, count: int) -> list[int]:
+            # Registers missing from the store are read as zero, like unused registers
+            # in between variables that are read in a single request.
             return [
-                int(store["server"]["registers"][str(r)], 16)  # type: ignore  # noqa: PGH003
+                int(store["server"]["registers"].get(str(r), "0000"), 16)  # type: ignore  # noqa: PGH003
                 for r in range(address, address + count)
             ]
 
@@ -224,6 +226,7 @@ def mock_config_entry(request) -> Generator[MockConfigEntry]:
     * `dhw_boiler_volume` (float): The DHW boiler volume in L. Defaults to 300. Since config v1.1
     * `dhw_boiler_heat_loss_rate (float): The DHW boiler heat loss rate in Watts. Defaults to 2.19. Since config v1.1
     * `dhw_energy_label (BoilerEnergyLabel | None): The DHW boiler energy label. Defaults to `None`. Since config v1.1
+    * `timeout` (float | None): The modbus network timeout in seconds. Defaults to `None`, which omits it.
     """
 
     if not hasattr(request, "param"):
@@ -242,6 +245,7 @@ def mock_config_entry(request) -> Generator[MockConfigEntry]:
             dhw_boiler_volume=args.get("dhw_boiler_volume", 300),
             dhw_boiler_heat_loss_rate=args.get("dhw_boiler_heat_loss_rate", 2.19),
             dhw_energy_label=args.get("dhw_energy_label"),
+            timeout=args.get("timeout"),
         )
 
 
@@ -346,7 +350,7 @@ async def setup_platform(
         await hass.async_block_till_done()
 
         # Register our services
-        register_services(hass, config_entry, config_entry.runtime_data["coordinator"])
+        register_services(hass, config_entry, config_entry.runtime_data.coordinator)
 
     # Ensure hass and RemehaApi are using the same time zone.
     await hass.config.async_update(time_zone=TESTING_TIME_ZONE)
@@ -361,6 +365,8 @@ def _create_config_entry(
     dhw_boiler_volume: float = 300,
     dhw_boiler_heat_loss_rate: float = 2.19,
     dhw_energy_label: BoilerEnergyLabel | None = None,
+    *,
+    timeout: float | None = None,
 ) -> MockConfigEntry:
     """Mock a config entry for Remeha Modbus integration."""
 
@@ -373,6 +379,9 @@ def _create_config_entry(
         CONF_PORT: 8899,
     }
 
+    if timeout is not None:
+        entry_data[CONF_TIMEOUT] = timeout
+
     # v1.1, v1.2
     if version[1] in [1, 2]:
         entry_data |= {CONFIG_AUTO_SCHEDULE: auto_scheduling}
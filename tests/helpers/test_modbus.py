@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+import pytest
 from dateutil import tz
 
 from custom_components.remeha_modbus.const import (
@@ -75,6 +76,14 @@ def test_from_registers_happy_path():
         == 20.1
     )
 
+    # Negative INT16, scale 0.1
+    assert (
+        modbus.from_registers(
+            registers=[0xFFCE], destination_variable=ZoneRegisters.CURRENT_ROOM_TEMPERATURE
+        )
+        == -5.0
+    )
+
     # UINT16, scale 0.01
     assert (
         modbus.from_registers(
@@ -152,3 +161,68 @@ def test_from_registers_happy_path():
         )
         is None
     )
+
+
+def test_plan_register_blocks():
+    """Test that nearby variables are merged into as few register blocks as possible."""
+
+    variables = [
+        ZoneRegisters.MODE,
+        ZoneRegisters.TYPE,
+        ZoneRegisters.FUNCTION,
+        ZoneRegisters.SHORT_NAME,
+        ZoneRegisters.OWNING_DEVICE,
+        ZoneRegisters.CURRENT_ROOM_TEMPERATURE,
+    ]
+
+    blocks = modbus.plan_register_blocks(variables)
+    assert [(block.start_address, block.count) for block in blocks] == [(640, 10), (1104, 1)]
+    assert blocks[0].variables == (
+        ZoneRegisters.TYPE,
+        ZoneRegisters.FUNCTION,
+        ZoneRegisters.SHORT_NAME,
+        ZoneRegisters.OWNING_DEVICE,
+        ZoneRegisters.MODE,
+    )
+
+    # Blocks are split if they would exceed the maximum register count.
+    blocks = modbus.plan_register_blocks(variables, max_count=5)
+    assert [(block.start_address, block.count) for block in blocks] == [
+        (640, 5),
+        (646, 4),
+        (1104, 1),
+    ]
+
+    # Blocks are split if the gap between variables is too large.
+    blocks = modbus.plan_register_blocks(variables, max_gap=1)
+    assert [(block.start_address, block.count) for block in blocks] == [
+        (640, 7),
+        (649, 1),
+        (1104, 1),
+    ]
+
+
+def test_from_register_block():
+    """Test that all variables in a register block are deserialized from a single list of registers."""
+
+    (block,) = modbus.plan_register_blocks(
+        [
+            DeviceInstanceRegisters.TYPE_BOARD,
+            DeviceInstanceRegisters.SW_VERSION,
+            DeviceInstanceRegisters.HW_VERSION,
+            DeviceInstanceRegisters.ARTICLE_NUMBER,
+        ]
+    )
+    assert (block.start_address, block.count) == (129, 6)
+
+    assert modbus.from_register_block(
+        block=block, registers=[0x1E01, 0x0101, 0xFFFF, 0x0201, 0x0001, 0x0002]
+    ) == {
+        DeviceInstanceRegisters.TYPE_BOARD: (0x1E, 1),
+        DeviceInstanceRegisters.SW_VERSION: (1, 1),
+        DeviceInstanceRegisters.HW_VERSION: (2, 1),
+        DeviceInstanceRegisters.ARTICLE_NUMBER: 0x00010002,
+    }
+
+    with pytest.raises(ValueError):
+        modbus.from_register_block(block=block, registers=[0x1E01])
@@ -8,7 +8,7 @@ import pytest
 from homeassistant import config_entries
 from homeassistant.components.weather.const import DOMAIN as WeatherDomain
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TYPE
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TIMEOUT, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType, InvalidData
 from homeassistant.helpers.entity_component import EntityComponent
@@ -26,6 +26,7 @@ from custom_components.remeha_modbus.const import (
     DOMAIN,
     HA_CONFIG_MINOR_VERSION,
     HA_CONFIG_VERSION,
+    MODBUS_DEFAULT_TIMEOUT,
     MODBUS_DEVICE_ADDRESS,
     MODBUS_SERIAL_BAUDRATE,
     MODBUS_SERIAL_BYTESIZE,
@@ -155,6 +156,7 @@ async def test_config_modbus_socket(hass: HomeAssistant, mock_setup_entry: Async
         MODBUS_DEVICE_ADDRESS: 100,
         CONF_HOST: "192.168.1.1",
         CONF_PORT: 502,
+        CONF_TIMEOUT: MODBUS_DEFAULT_TIMEOUT,
         CONFIG_AUTO_SCHEDULE: False,
     }
     assert len(mock_setup_entry.mock_calls) == 1
@@ -222,6 +224,7 @@ async def test_config_auto_scheduling(hass: HomeAssistant, mock_setup_entry: Asy
         MODBUS_DEVICE_ADDRESS: 100,
         CONF_HOST: "192.168.1.1",
         CONF_PORT: 502,
+        CONF_TIMEOUT: MODBUS_DEFAULT_TIMEOUT,
         CONFIG_AUTO_SCHEDULE: True,
         WEATHER_ENTITY_ID: "weather.fake_weather",
         AUTO_SCHEDULE_SELECTED_SCHEDULE: REMEHA_PRESET_SCHEDULE_1,
@@ -319,6 +322,7 @@ async def test_config_auto_scheduling_no_installation_date(
         MODBUS_DEVICE_ADDRESS: 100,
         CONF_HOST: "192.168.1.1",
         CONF_PORT: 502,
+        CONF_TIMEOUT: MODBUS_DEFAULT_TIMEOUT,
         CONFIG_AUTO_SCHEDULE: True,
         WEATHER_ENTITY_ID: "weather.fake_weather",
         AUTO_SCHEDULE_SELECTED_SCHEDULE: REMEHA_PRESET_SCHEDULE_1,
@@ -398,6 +402,7 @@ async def test_reconfigure_non_unique_id(
             MODBUS_DEVICE_ADDRESS: 100,
             CONF_HOST: "also.does.not.matter",
             CONF_PORT: 502,
+            CONF_TIMEOUT: MODBUS_DEFAULT_TIMEOUT,
             CONFIG_AUTO_SCHEDULE: False,
         }
 
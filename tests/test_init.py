@@ -1,10 +1,96 @@
 """Test component setup."""
 
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from pymodbus import ModbusException
 
 from custom_components.remeha_modbus.const import DOMAIN
+from tests.conftest import get_api, setup_platform
 
 
 async def test_async_setup(hass):
     """Test the component gets setup."""
     assert await async_setup_component(hass, DOMAIN, {}) is True
+
+
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_setup_entry_health_check_timeout(
+    hass: HomeAssistant, mock_modbus_client, mock_config_entry
+):
+    """Test that an unresponsive modbus device causes the entry setup to be retried later."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+
+    async def _async_unresponsive_health_check() -> None:
+        await asyncio.Event().wait()
+
+    mock_config_entry.add_to_hass(hass=hass)
+    with (
+        patch(
+            "custom_components.remeha_modbus.api.RemehaApi.create", new=lambda *args, **kwargs: api
+        ),
+        patch.object(api, "async_health_check", new=_async_unresponsive_health_check),
+        patch("custom_components.remeha_modbus.MODBUS_SETUP_HEALTH_CHECK_TIMEOUT", new=0),
+        patch("custom_components.remeha_modbus.MODBUS_DEFAULT_TIMEOUT", new=0),
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+@pytest.mark.parametrize("mock_config_entry", [{"timeout": 30.0}], indirect=True)
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_setup_entry_slow_health_check_within_configured_timeout(
+    hass: HomeAssistant, mock_modbus_client, mock_config_entry
+):
+    """Test that a health check slower than the default setup deadline succeeds for a larger timeout."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+    health_check = api.async_health_check
+
+    async def _async_slow_health_check() -> None:
+        # Slower than the (patched) default deadline, but well within 3 attempts of 30 seconds.
+        await asyncio.sleep(0.05)
+        await health_check()
+
+    with (
+        patch(
+            "custom_components.remeha_modbus.api.RemehaApi.create", new=lambda *args, **kwargs: api
+        ),
+        patch.object(api, "async_health_check", new=_async_slow_health_check),
+        patch("custom_components.remeha_modbus.MODBUS_SETUP_HEALTH_CHECK_TIMEOUT", new=0.01),
+    ):
+        await setup_platform(hass=hass, config_entry=mock_config_entry)
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+
+
+@pytest.mark.parametrize("mock_modbus_client", ["modbus_store.json"], indirect=True)
+async def test_setup_entry_first_refresh_failure_closes_api(
+    hass: HomeAssistant, mock_modbus_client, mock_config_entry
+):
+    """Test that the modbus client is released if the first data refresh fails."""
+
+    api = get_api(mock_modbus_client=mock_modbus_client)
+
+    mock_config_entry.add_to_hass(hass=hass)
+    with (
+        patch(
+            "custom_components.remeha_modbus.api.RemehaApi.create", new=lambda *args, **kwargs: api
+        ),
+        patch.object(
+            api, "async_read_device_instances", side_effect=ModbusException("No response")
+        ),
+        patch.object(api, "async_close") as async_close,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+    async_close.assert_awaited_once()
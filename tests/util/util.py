@@ -312,7 +312,7 @@ class SchedulerStorageStub:
 def set_storage_stub_return_value(mock_config_entry: MockConfigEntry, scheduler_storage):
     """Mock implementation of scheduler.store.async_get_registry."""
 
-    coordinator: SchedulerCoordinatorStub = mock_config_entry.runtime_data["coordinator"]
+    coordinator: SchedulerCoordinatorStub = mock_config_entry.runtime_data.coordinator
     scheduler_storage.return_value = SchedulerStorageStub(coordinator=coordinator)
 
     return scheduler_storage